@@ -29,6 +29,25 @@ mod platform {
         fn CGDisplayShowCursor(display: u32) -> i32;
     }
 
+    // Creating a HID event source goes through the window server, and the
+    // position query runs at poll rate. Create the source once per thread
+    // and hand out retained clones (a refcount bump) instead. Left empty on
+    // failure so a transient error at startup is retried on the next call.
+    thread_local! {
+        static EVENT_SOURCE: std::cell::RefCell<Option<CGEventSource>> =
+            std::cell::RefCell::new(None);
+    }
+
+    fn event_source() -> Option<CGEventSource> {
+        EVENT_SOURCE.with(|slot| {
+            let mut slot = slot.borrow_mut();
+            if slot.is_none() {
+                *slot = CGEventSource::new(CGEventSourceStateID::HIDSystemState).ok();
+            }
+            slot.clone()
+        })
+    }
+
     /// Hide the mouse cursor (when controlling remote)
     pub fn hide_cursor() {
         unsafe {
@@ -92,7 +111,7 @@ mod platform {
     }
 
     pub fn get_mouse_position() -> (i32, i32) {
-        if let Ok(source) = CGEventSource::new(CGEventSourceStateID::HIDSystemState) {
+        if let Some(source) = event_source() {
             if let Ok(event) = CGEvent::new(source) {
                 let location = event.location();
                 return (location.x as i32, location.y as i32);
@@ -103,7 +122,7 @@ mod platform {
 
     pub fn move_mouse(x: i32, y: i32) {
         let point = CGPoint::new(x as f64, y as f64);
-        if let Ok(source) = CGEventSource::new(CGEventSourceStateID::HIDSystemState) {
+        if let Some(source) = event_source() {
             if let Ok(event) = CGEvent::new_mouse_event(
                 source,
                 CGEventType::MouseMoved,
@@ -120,9 +139,9 @@ mod platform {
     }
 
     pub fn mouse_click(button: &str, action: &str) {
-        let source = match CGEventSource::new(CGEventSourceStateID::HIDSystemState) {
-            Ok(s) => s,
-            Err(_) => return,
+        let source = match event_source() {
+            Some(s) => s,
+            None => return,
         };
         
         let (event_type, mouse_button) = match (button, action) {
@@ -143,15 +162,149 @@ mod platform {
         }
     }
 
+    /// Sentinel for Windows VK codes with no macOS equivalent.
+    const VK_UNMAPPED: u8 = 0xFF;
+
+    /// Windows virtual-key code -> macOS CGKeyCode, as a flat 256-entry
+    /// table so the per-keystroke translation is a single indexed load.
+    /// The wire protocol carries Windows VK codes (both senders emit them);
+    /// CGEvent wants the mac hardware keycode, which shares no numbering.
+    const fn build_vk_to_mac() -> [u8; 256] {
+        let mut t = [VK_UNMAPPED; 256];
+        t[0x08] = 51;  // Backspace -> Delete
+        t[0x09] = 48;  // Tab
+        t[0x0D] = 36;  // Return
+        t[0x10] = 56;  // Shift
+        t[0x11] = 59;  // Control
+        t[0x12] = 58;  // Alt -> Option
+        // Side-specific modifiers: rdev_key_to_vk on the sender emits these
+        // (0xA0-0xA5), never the generic 0x10-0x12 above, so they must map
+        // or every forwarded Shift/Ctrl/Alt chord dies here.
+        t[0xA0] = 56;  // LShift
+        t[0xA1] = 60;  // RShift
+        t[0xA2] = 59;  // LControl
+        t[0xA3] = 62;  // RControl
+        t[0xA4] = 58;  // LAlt -> Option
+        t[0xA5] = 61;  // RAlt -> Right Option
+        t[0x14] = 57;  // CapsLock
+        t[0x1B] = 53;  // Escape
+        t[0x20] = 49;  // Space
+        t[0x21] = 116; // PageUp
+        t[0x22] = 121; // PageDown
+        t[0x23] = 119; // End
+        t[0x24] = 115; // Home
+        t[0x25] = 123; // Left arrow
+        t[0x26] = 126; // Up arrow
+        t[0x27] = 124; // Right arrow
+        t[0x28] = 125; // Down arrow
+        t[0x2E] = 117; // Delete (forward)
+        // Digit row 0-9
+        t[0x30] = 29;
+        t[0x31] = 18;
+        t[0x32] = 19;
+        t[0x33] = 20;
+        t[0x34] = 21;
+        t[0x35] = 23;
+        t[0x36] = 22;
+        t[0x37] = 26;
+        t[0x38] = 28;
+        t[0x39] = 25;
+        // Letters A-Z (ANSI layout keycodes)
+        t[0x41] = 0;   // A
+        t[0x42] = 11;  // B
+        t[0x43] = 8;   // C
+        t[0x44] = 2;   // D
+        t[0x45] = 14;  // E
+        t[0x46] = 3;   // F
+        t[0x47] = 5;   // G
+        t[0x48] = 4;   // H
+        t[0x49] = 34;  // I
+        t[0x4A] = 38;  // J
+        t[0x4B] = 40;  // K
+        t[0x4C] = 37;  // L
+        t[0x4D] = 46;  // M
+        t[0x4E] = 45;  // N
+        t[0x4F] = 31;  // O
+        t[0x50] = 35;  // P
+        t[0x51] = 12;  // Q
+        t[0x52] = 15;  // R
+        t[0x53] = 1;   // S
+        t[0x54] = 17;  // T
+        t[0x55] = 32;  // U
+        t[0x56] = 9;   // V
+        t[0x57] = 13;  // W
+        t[0x58] = 7;   // X
+        t[0x59] = 16;  // Y
+        t[0x5A] = 6;   // Z
+        t[0x5B] = 55;  // LWin -> Command
+        t[0x5C] = 54;  // RWin -> Right Command
+        // Numpad
+        t[0x60] = 82;
+        t[0x61] = 83;
+        t[0x62] = 84;
+        t[0x63] = 85;
+        t[0x64] = 86;
+        t[0x65] = 87;
+        t[0x66] = 88;
+        t[0x67] = 89;
+        t[0x68] = 91;
+        t[0x69] = 92;
+        t[0x6A] = 67;  // Kp *
+        t[0x6B] = 69;  // Kp +
+        t[0x6D] = 78;  // Kp -
+        t[0x6E] = 65;  // Kp .
+        t[0x6F] = 75;  // Kp /
+        // Function row
+        t[0x70] = 122; // F1
+        t[0x71] = 120; // F2
+        t[0x72] = 99;  // F3
+        t[0x73] = 118; // F4
+        t[0x74] = 96;  // F5
+        t[0x75] = 97;  // F6
+        t[0x76] = 98;  // F7
+        t[0x77] = 100; // F8
+        t[0x78] = 101; // F9
+        t[0x79] = 109; // F10
+        t[0x7A] = 103; // F11
+        t[0x7B] = 111; // F12
+        // Punctuation (US layout)
+        t[0xBA] = 41;  // ;
+        t[0xBB] = 24;  // =
+        t[0xBC] = 43;  // ,
+        t[0xBD] = 27;  // -
+        t[0xBE] = 47;  // .
+        t[0xBF] = 44;  // /
+        t[0xC0] = 50;  // `
+        t[0xDB] = 33;  // [
+        t[0xDC] = 42;  // \
+        t[0xDD] = 30;  // ]
+        t[0xDE] = 39;  // '
+        t
+    }
+
+    static VK_TO_MAC: [u8; 256] = build_vk_to_mac();
+
     pub fn key_event(key_code: u32, action: &str) {
-        let source = match CGEventSource::new(CGEventSourceStateID::HIDSystemState) {
-            Ok(s) => s,
-            Err(_) => return,
+        // Translate the Windows VK code from the wire to a mac keycode.
+        // Previously the VK code was posted as-is, which typed the wrong
+        // characters for almost every key (the two numberings only agree
+        // by coincidence). Unmapped keys are dropped rather than guessed.
+        if key_code > 0xFF {
+            return;
+        }
+        let mac_code = VK_TO_MAC[key_code as usize];
+        if mac_code == VK_UNMAPPED {
+            return;
+        }
+
+        let source = match event_source() {
+            Some(s) => s,
+            None => return,
         };
-        
+
         let keydown = action == "press";
-        
-        if let Ok(event) = CGEvent::new_keyboard_event(source, key_code as u16, keydown) {
+
+        if let Ok(event) = CGEvent::new_keyboard_event(source, mac_code as u16, keydown) {
             event.post(CGEventTapLocation::HID);
         }
     }
@@ -408,3 +561,27 @@ mod platform {
 }
 
 pub use platform::*;
+
+// Display enumeration is an OS query, and callers hit it from polling paths
+// (UI refresh, tracking loop, message handlers). Topology changes are rare,
+// so serve a cached list and re-enumerate at most every few seconds. No
+// change notification is wired up; a short staleness window after plugging
+// a monitor is acceptable here.
+const SCREEN_CACHE_TTL: std::time::Duration = std::time::Duration::from_secs(5);
+
+static SCREEN_CACHE: once_cell::sync::Lazy<std::sync::RwLock<Option<(std::time::Instant, Vec<ScreenInfo>)>>> =
+    once_cell::sync::Lazy::new(|| std::sync::RwLock::new(None));
+
+/// Cached wrapper over the platform display enumeration. Shadows the glob
+/// re-export above, so every `input::get_all_screens` caller goes through
+/// the cache.
+pub fn get_all_screens() -> Vec<ScreenInfo> {
+    if let Some((at, screens)) = SCREEN_CACHE.read().unwrap().as_ref() {
+        if at.elapsed() < SCREEN_CACHE_TTL {
+            return screens.clone();
+        }
+    }
+    let screens = platform::get_all_screens();
+    *SCREEN_CACHE.write().unwrap() = Some((std::time::Instant::now(), screens.clone()));
+    screens
+}
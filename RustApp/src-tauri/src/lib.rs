@@ -65,29 +65,12 @@ pub struct Modifiers {
 
 #[tauri::command]
 fn get_local_ip() -> String {
-    local_ip_address::local_ip()
-        .map(|ip| ip.to_string())
-        .unwrap_or_else(|_| "Unknown".to_string())
+    network::LOCAL_IP.clone().unwrap_or_else(|| "Unknown".to_string())
 }
 
 #[tauri::command]
 fn get_computer_name() -> String {
-    #[cfg(target_os = "macos")]
-    {
-        std::process::Command::new("scutil")
-            .args(["--get", "ComputerName"])
-            .output()
-            .map(|o| String::from_utf8_lossy(&o.stdout).trim().to_string())
-            .unwrap_or_else(|_| "Mac".to_string())
-    }
-    #[cfg(target_os = "windows")]
-    {
-        std::env::var("COMPUTERNAME").unwrap_or_else(|_| "Windows PC".to_string())
-    }
-    #[cfg(not(any(target_os = "macos", target_os = "windows")))]
-    {
-        "Unknown".to_string()
-    }
+    network::get_computer_name()
 }
 
 #[tauri::command]
@@ -238,6 +221,7 @@ fn set_screen_layout(remote_edge: String) -> Result<(), String> {
     let current = network::REMOTE_EDGE.read().unwrap().clone();
     if current != remote_edge {
         *network::REMOTE_EDGE.write().unwrap() = remote_edge.clone();
+        network::invalidate_edge_trigger();
         println!("📐 Screen layout updated: Windows is to the {} of Mac", remote_edge);
     }
     Ok(())
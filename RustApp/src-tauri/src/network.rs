@@ -4,19 +4,39 @@
 use tokio::net::{TcpListener, TcpStream, UdpSocket};
 use tokio::net::tcp::OwnedWriteHalf;
 use tokio::io::{AsyncWriteExt, AsyncBufReadExt, BufReader};
+use tokio::sync::mpsc;
 use serde::{Deserialize, Serialize};
-use std::sync::Arc;
-use tokio::sync::Mutex;
 use once_cell::sync::Lazy;
 use std::sync::RwLock;
 use std::net::SocketAddr;
 
 const TCP_PORT: u16 = 52525;
 const UDP_PORT: u16 = 52526;
+// Loss-tolerant event traffic (mouse_move) goes over UDP on its own port;
+// everything stateful stays on TCP.
+const UDP_EVENT_PORT: u16 = 52527;
 const DISCOVERY_MAGIC: &str = "MACWINCTRL";
 
+/// Seconds since the Unix epoch. One helper instead of the four-line
+/// SystemTime chain repeated at every timestamp site.
+fn now_secs() -> u64 {
+    std::time::SystemTime::now()
+        .duration_since(std::time::UNIX_EPOCH)
+        .unwrap_or_default()
+        .as_secs()
+}
+
 // Global storage for received remote screens
 pub static REMOTE_SCREENS: Lazy<RwLock<Vec<ReceivedScreen>>> = Lazy::new(|| RwLock::new(Vec::new()));
+// Bounding box of REMOTE_SCREENS, refreshed whenever the list changes.
+// None until the peer's hello arrives. The per-sample paths read this
+// instead of re-reducing the screen list.
+static REMOTE_BOUNDS: Lazy<RwLock<Option<Bounds>>> = Lazy::new(|| RwLock::new(None));
+// Local counterpart: bounding box of this machine's screens, refreshed by
+// the tracking loop's debug tick (which enumerates screens anyway, every
+// ~0.5 s). The per-event edge check reads this instead of asking the OS
+// for the display list again.
+static LOCAL_BOUNDS: Lazy<RwLock<Option<Bounds>>> = Lazy::new(|| RwLock::new(None));
 
 // Global storage for discovered peers
 pub static DISCOVERED_PEERS: Lazy<RwLock<Vec<DiscoveredPeer>>> = Lazy::new(|| RwLock::new(Vec::new()));
@@ -24,23 +44,62 @@ pub static DISCOVERED_PEERS: Lazy<RwLock<Vec<DiscoveredPeer>>> = Lazy::new(|| Rw
 // Connection state
 pub static IS_CONNECTED: Lazy<RwLock<bool>> = Lazy::new(|| RwLock::new(false));
 pub static CONNECTED_TO: Lazy<RwLock<Option<String>>> = Lazy::new(|| RwLock::new(None));
+// Woken whenever a connection is established, so idle tasks (heartbeat) can
+// park on it instead of polling the flag on a timer.
+static CONNECTED_NOTIFY: Lazy<tokio::sync::Notify> = Lazy::new(tokio::sync::Notify::new);
 
-// Separate write half for sending messages (avoids deadlock with read loop)
-pub static WRITE_STREAM: Lazy<RwLock<Option<Arc<Mutex<OwnedWriteHalf>>>>> = Lazy::new(|| RwLock::new(None));
+// Outbound frame queue. A dedicated writer task owns the write half of the
+// connection; every other thread/task (read loops, the rdev input listener,
+// the mouse tracker) just enqueues encoded frames and never blocks on the
+// socket. Bounded so a stalled peer cannot grow memory without limit. No
+// lock is held around the send itself - producers take a brief read guard
+// to reach the channel, and the channel handles the cross-thread handoff.
+const OUT_QUEUE_DEPTH: usize = 256;
+pub static OUT_TX: Lazy<RwLock<Option<mpsc::Sender<Vec<u8>>>>> = Lazy::new(|| RwLock::new(None));
 
 // Track if we initiated the connection (outgoing) or received it (incoming)
 pub static IS_OUTGOING_CONNECTION: Lazy<RwLock<bool>> = Lazy::new(|| RwLock::new(false));
 
-// Control state - which computer has mouse/keyboard control
-pub static CONTROL_ACTIVE: Lazy<RwLock<bool>> = Lazy::new(|| RwLock::new(false));  // true = we're controlling remote
+// Control state - which computer has mouse/keyboard control.
+// CONTROL_ACTIVE is checked on every rdev callback (every physical input
+// event), so it is an atomic rather than an RwLock: the idle-path gate is
+// a single relaxed load instead of a lock acquisition.
+pub static CONTROL_ACTIVE: std::sync::atomic::AtomicBool = std::sync::atomic::AtomicBool::new(false);  // true = we're controlling remote
 pub static BEING_CONTROLLED: Lazy<RwLock<bool>> = Lazy::new(|| RwLock::new(false));  // true = remote is controlling us
 
+// Local modifier state, tracked from the rdev hook in every mode so hotkey
+// combinations (e.g. a future escape shortcut) can be recognized cheaply.
+static CTRL_PRESSED: std::sync::atomic::AtomicBool = std::sync::atomic::AtomicBool::new(false);
+static ALT_PRESSED: std::sync::atomic::AtomicBool = std::sync::atomic::AtomicBool::new(false);
+
+// Keys this machine has synthesized as held down on behalf of the remote.
+// Once control ends, the peer can no longer forward the matching releases
+// (its hook stops forwarding the instant it drops CONTROL_ACTIVE), so these
+// are lifted in bulk on control_end and on disconnect - otherwise the
+// escape hotkey's own Ctrl/Alt, or anything held while crossing back over
+// the edge, stays stuck down here. A handful of entries at most; a Vec
+// under a Mutex is plenty.
+static REMOTE_HELD_KEYS: Lazy<std::sync::Mutex<Vec<u32>>> =
+    Lazy::new(|| std::sync::Mutex::new(Vec::new()));
+
+/// Release every key the remote left synthesized as down.
+fn lift_remote_held_keys() {
+    let held = std::mem::take(&mut *REMOTE_HELD_KEYS.lock().unwrap());
+    for key_code in held {
+        println!("⌨️ Lifting key {} still held after control ended", key_code);
+        crate::input::key_event(key_code, "release");
+    }
+}
+
 // Edge lock state - where to keep local mouse pinned while controlling remote
 pub static EDGE_LOCK_POS: Lazy<RwLock<(i32, i32)>> = Lazy::new(|| RwLock::new((0, 0)));
 // Current remote mouse position (tracked locally)
 pub static REMOTE_MOUSE_POS: Lazy<RwLock<(i32, i32)>> = Lazy::new(|| RwLock::new((0, 0)));
-// Timestamp when control started (to prevent immediate return)
-pub static CONTROL_START_TIME: Lazy<RwLock<u64>> = Lazy::new(|| RwLock::new(0));
+// Instant when control started (to prevent immediate return). Monotonic so
+// a wall-clock adjustment (NTP step, DST) cannot shorten or stretch the
+// return cooldown.
+pub static CONTROL_START_TIME: Lazy<RwLock<std::time::Instant>> =
+    Lazy::new(|| RwLock::new(std::time::Instant::now()));
 
 // Screen layout configuration - which edge leads to which computer
 // Format: "right" means Windows is to the right of Mac
@@ -52,6 +111,30 @@ pub static SYNCED_LAYOUT: Lazy<RwLock<Option<String>>> = Lazy::new(|| RwLock::ne
 // Debug state for UI
 pub static DEBUG_INFO: Lazy<RwLock<DebugInfo>> = Lazy::new(|| RwLock::new(DebugInfo::default()));
 
+// Local IP resolved once at first use. Resolution walks the interface /
+// routing tables each call, and the address doesn't change while the app
+// runs - the UI polls this, so cache it.
+pub static LOCAL_IP: Lazy<Option<String>> = Lazy::new(|| {
+    local_ip_address::local_ip().map(|ip| ip.to_string()).ok()
+});
+
+// Unconnected datagram socket for outgoing mouse_move events. A std socket
+// so the tracking loop can fire-and-forget without touching the runtime;
+// nonblocking so a full socket buffer drops the move instead of stalling.
+static UDP_EVENT_SOCKET: Lazy<Option<std::net::UdpSocket>> = Lazy::new(|| {
+    let sock = std::net::UdpSocket::bind("0.0.0.0:0").ok()?;
+    sock.set_nonblocking(true).ok()?;
+    // A deeper send buffer rides out short scheduler stalls without
+    // dropping moves; a failure here is harmless, the default still works.
+    let _ = socket2::SockRef::from(&sock).set_send_buffer_size(256 * 1024);
+    Some(sock)
+});
+// Where to aim move datagrams; set alongside CONNECTED_TO, cleared on disconnect.
+static UDP_PEER: Lazy<RwLock<Option<SocketAddr>>> = Lazy::new(|| RwLock::new(None));
+// Sequence stamping/dedup: UDP can reorder, and a stale move must never win.
+static MOVE_TX_SEQ: std::sync::atomic::AtomicU64 = std::sync::atomic::AtomicU64::new(0);
+static MOVE_RX_SEQ: std::sync::atomic::AtomicU64 = std::sync::atomic::AtomicU64::new(0);
+
 #[derive(Clone, Serialize, Debug, Default)]
 pub struct DebugInfo {
     pub mouse_x: i32,
@@ -92,7 +175,57 @@ pub struct ScreenData {
     pub is_primary: bool,
 }
 
-#[derive(Clone, Serialize, Deserialize, Debug)]
+/// Axis-aligned bounding box over a set of screens, computed in a single
+/// pass instead of the four separate iterator reductions the call sites
+/// used to run. Falls back to a 1920x1080 desktop when no screens are known,
+/// matching the per-reduction defaults it replaces.
+#[derive(Clone, Copy, Debug, PartialEq, Eq)]
+pub struct Bounds {
+    pub min_x: i32,
+    pub max_x: i32,
+    pub min_y: i32,
+    pub max_y: i32,
+}
+
+impl Bounds {
+    /// Stand-in desktop used wherever no real screen data is available yet.
+    const FALLBACK: Bounds = Bounds { min_x: 0, max_x: 1920, min_y: 0, max_y: 1080 };
+
+    fn from_rects(rects: impl Iterator<Item = (i32, i32, i32, i32)>) -> Bounds {
+        let mut b = Bounds { min_x: i32::MAX, max_x: i32::MIN, min_y: i32::MAX, max_y: i32::MIN };
+        let mut any = false;
+        for (x, y, w, h) in rects {
+            any = true;
+            b.min_x = b.min_x.min(x);
+            b.max_x = b.max_x.max(x + w);
+            b.min_y = b.min_y.min(y);
+            b.max_y = b.max_y.max(y + h);
+        }
+        if any { b } else { Bounds::FALLBACK }
+    }
+    
+    pub fn of_local(screens: &[crate::input::ScreenInfo]) -> Bounds {
+        Bounds::from_rects(screens.iter().map(|s| (s.x, s.y, s.width, s.height)))
+    }
+    
+    pub fn of_remote(screens: &[ReceivedScreen]) -> Bounds {
+        Bounds::from_rects(screens.iter().map(|s| (s.x, s.y, s.width, s.height)))
+    }
+
+    /// True when the point lies inside the bounds (max edges exclusive,
+    /// matching the `max - 1` convention of `clamp_point`).
+    pub fn contains(&self, x: i32, y: i32) -> bool {
+        x >= self.min_x && x < self.max_x && y >= self.min_y && y < self.max_y
+    }
+
+    /// Clamp a point into the bounds, keeping it on the last addressable
+    /// pixel row/column rather than one past it.
+    pub fn clamp_point(&self, x: i32, y: i32) -> (i32, i32) {
+        (x.clamp(self.min_x, self.max_x - 1), y.clamp(self.min_y, self.max_y - 1))
+    }
+}
+
+#[derive(Clone, Serialize, Deserialize, Debug, Default)]
 pub struct Message {
     #[serde(rename = "type")]
     pub msg_type: String,
@@ -129,104 +262,139 @@ pub struct Message {
     
     #[serde(skip_serializing_if = "Option::is_none")]
     pub layout: Option<String>,  // JSON string of saved layout positions
+    
+    #[serde(skip_serializing_if = "Option::is_none")]
+    pub seq: Option<u64>,  // ordering for frames that may arrive over UDP
 }
 
+// Wire names for Message.msg_type. Defined once so the receive-side
+// dispatch match and the constructors can't drift apart on a typo'd
+// literal; the hot formatters below embed the same names in their
+// format strings.
+const MSG_HELLO: &str = "hello";
+const MSG_CLIPBOARD: &str = "clipboard";
+const MSG_PING: &str = "ping";
+const MSG_PONG: &str = "pong";
+const MSG_LAYOUT_SYNC: &str = "layout_sync";
+const MSG_CONTROL_START: &str = "control_start";
+const MSG_CONTROL_END: &str = "control_end";
+const MSG_MOUSE_MOVE: &str = "mouse_move";
+const MSG_MOUSE_CLICK: &str = "mouse_click";
+const MSG_KEY_EVENT: &str = "key_event";
+
 #[allow(dead_code)]
 impl Message {
     pub fn hello_with_screens(name: &str, screens: Vec<ScreenData>, computer_type: &str) -> Self {
         Message {
-            msg_type: "hello".to_string(),
+            msg_type: MSG_HELLO.to_string(),
             name: Some(name.to_string()),
             version: Some("1.0".to_string()),
             screens: Some(screens),
             computer_type: Some(computer_type.to_string()),
-            x: None, y: None, button: None, action: None, 
-            key_code: None, text: None, layout: None,
+            ..Default::default()
         }
     }
     
     pub fn hello(name: &str) -> Self {
         Message {
-            msg_type: "hello".to_string(),
+            msg_type: MSG_HELLO.to_string(),
             name: Some(name.to_string()),
             version: Some("1.0".to_string()),
-            x: None, y: None, button: None, action: None, 
-            key_code: None, text: None, screens: None, computer_type: None, layout: None,
-        }
-    }
-    
-    pub fn mouse_move(x: i32, y: i32) -> Self {
-        Message {
-            msg_type: "mouse_move".to_string(),
-            x: Some(x),
-            y: Some(y),
-            button: None, action: None, key_code: None, 
-            text: None, name: None, version: None,
-            screens: None, computer_type: None, layout: None,
-        }
-    }
-    
-    pub fn mouse_click(button: &str, action: &str) -> Self {
-        Message {
-            msg_type: "mouse_click".to_string(),
-            button: Some(button.to_string()),
-            action: Some(action.to_string()),
-            x: None, y: None, key_code: None, 
-            text: None, name: None, version: None,
-            screens: None, computer_type: None, layout: None,
-        }
-    }
-    
-    pub fn key_event(key_code: u32, action: &str) -> Self {
-        Message {
-            msg_type: "key_event".to_string(),
-            key_code: Some(key_code),
-            action: Some(action.to_string()),
-            x: None, y: None, button: None, 
-            text: None, name: None, version: None,
-            screens: None, computer_type: None, layout: None,
+            ..Default::default()
         }
     }
     
     pub fn clipboard(text: &str) -> Self {
         Message {
-            msg_type: "clipboard".to_string(),
+            msg_type: MSG_CLIPBOARD.to_string(),
             text: Some(text.to_string()),
-            x: None, y: None, button: None, action: None, 
-            key_code: None, name: None, version: None,
-            screens: None, computer_type: None, layout: None,
+            ..Default::default()
         }
     }
     
     pub fn ping() -> Self {
         Message {
-            msg_type: "ping".to_string(),
-            x: None, y: None, button: None, action: None, 
-            key_code: None, text: None, name: None, version: None,
-            screens: None, computer_type: None, layout: None,
+            msg_type: MSG_PING.to_string(),
+            ..Default::default()
         }
     }
     
     pub fn pong() -> Self {
         Message {
-            msg_type: "pong".to_string(),
-            x: None, y: None, button: None, action: None, 
-            key_code: None, text: None, name: None, version: None,
-            screens: None, computer_type: None, layout: None,
+            msg_type: MSG_PONG.to_string(),
+            ..Default::default()
         }
     }
     
     pub fn layout_sync(layout_json: &str) -> Self {
         Message {
-            msg_type: "layout_sync".to_string(),
+            msg_type: MSG_LAYOUT_SYNC.to_string(),
             layout: Some(layout_json.to_string()),
-            x: None, y: None, button: None, action: None, 
-            key_code: None, text: None, name: None, version: None,
-            screens: None, computer_type: None,
+            ..Default::default()
         }
     }
 }
 
+// Fixed-content frames, encoded once. Sent as-is; no Message or serde
+// involved on these paths.
+const PING_FRAME: &[u8] = b"{\"type\":\"ping\"}\n";
+const PONG_FRAME: &[u8] = b"{\"type\":\"pong\"}\n";
+// control_end always hands the cursor back at (0,0) - the coordinates are
+// ignored by the receiver - so the frame is constant too.
+const CONTROL_END_FRAME: &[u8] = b"{\"type\":\"control_end\",\"x\":0,\"y\":0}\n";
+
+/// Raise the kernel send/receive buffers on a connection socket. The OS
+/// defaults (notably on macOS) are small enough that a burst of frames can
+/// stall the writer on a full buffer; 256 KiB absorbs bursts comfortably.
+/// Nagle is disabled separately (set_nodelay at both connect and accept);
+/// the writer's application-level batching keeps that from producing
+/// tinygrams. TCP_QUICKACK would help the ack path but is Linux-only, and
+/// this app ships on macOS and Windows.
+fn tune_socket(stream: &TcpStream) {
+    let sock = socket2::SockRef::from(stream);
+    if let Err(e) = sock.set_send_buffer_size(256 * 1024) {
+        println!("⚠️ Could not set send buffer size: {}", e);
+    }
+    if let Err(e) = sock.set_recv_buffer_size(256 * 1024) {
+        println!("⚠️ Could not set recv buffer size: {}", e);
+    }
+    // Kernel-level keepalive backs up the application pings: if the peer
+    // vanishes without a FIN (sleep, cable pull), the reader's read_line
+    // would otherwise block indefinitely. Short timings are fine on a LAN.
+    let keepalive = socket2::TcpKeepalive::new()
+        .with_time(std::time::Duration::from_secs(10))
+        .with_interval(std::time::Duration::from_secs(5));
+    if let Err(e) = sock.set_tcp_keepalive(&keepalive) {
+        println!("⚠️ Could not enable TCP keepalive: {}", e);
+    }
+}
+
+/// Encode a message straight to its newline-terminated wire bytes.
+/// serde_json::to_vec skips the intermediate String (and its UTF-8 round
+/// trip) that to_string + concat paid on every event.
+fn encode_frame(msg: &Message) -> serde_json::Result<Vec<u8>> {
+    let mut buf = serde_json::to_vec(msg)?;
+    buf.push(b'\n');
+    Ok(buf)
+}
+
+/// Reset all shared connection state after a disconnect.
+/// Also clears control state so neither machine is left with a hidden
+/// cursor or a stale "being controlled" flag.
+fn clear_connection_state() {
+    *IS_CONNECTED.write().unwrap() = false;
+    *CONNECTED_TO.write().unwrap() = None;
+    *UDP_PEER.write().unwrap() = None;
+    *OUT_TX.write().unwrap() = None;
+    *IS_OUTGOING_CONNECTION.write().unwrap() = false;
+    CONTROL_ACTIVE.store(false, std::sync::atomic::Ordering::Relaxed);
+    *BEING_CONTROLLED.write().unwrap() = false;
+    // A dropped connection means no control_end will arrive; don't leave
+    // the remote's half-typed chord stuck down.
+    lift_remote_held_keys();
+    crate::input::show_cursor();
+}
+
 pub async fn start_server(port: u16) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     let listener = TcpListener::bind(format!("0.0.0.0:{}", port)).await?;
     println!("🖥️ Server listening on port {}", port);
@@ -250,24 +418,33 @@ pub async fn start_server(port: u16) -> Result<(), Box<dyn std::error::Error + S
         
         println!("📥 New incoming connection from: {}", addr);
         
+        // Input frames are tiny and latency-sensitive; don't let Nagle
+        // batch them behind unacked data.
+        if let Err(e) = stream.set_nodelay(true) {
+            println!("⚠️ Could not set TCP_NODELAY: {}", e);
+        }
+        tune_socket(&stream);
+        
         // Split the stream into read and write halves (just like connect_to_server does)
         let (read_half, write_half) = stream.into_split();
         
-        // Store write half for sending messages (this is the KEY FIX!)
+        // Start a writer task for this connection.
         // Only set if we don't already have one from an outgoing connection
         let has_outgoing = *IS_OUTGOING_CONNECTION.read().unwrap();
         if !has_outgoing {
-            let write_arc = Arc::new(Mutex::new(write_half));
-            println!("📤 Setting WRITE_STREAM for incoming connection (we are server)");
-            *WRITE_STREAM.write().unwrap() = Some(write_arc);
+            println!("📤 Starting writer task for incoming connection (we are server)");
+            *OUT_TX.write().unwrap() = Some(spawn_writer(write_half));
         } else {
-            println!("📝 Keeping existing outgoing WRITE_STREAM");
+            println!("📝 Keeping existing outgoing writer task");
             // We still need to handle the write_half somehow - drop it since we won't use it
             drop(write_half);
         }
         
         *IS_CONNECTED.write().unwrap() = true;
         *CONNECTED_TO.write().unwrap() = Some(addr.ip().to_string());
+        *UDP_PEER.write().unwrap() = Some(SocketAddr::new(addr.ip(), UDP_EVENT_PORT));
+        CONNECTED_NOTIFY.notify_one();
+        ensure_input_listener();
         
         // Spawn read loop for this client using the read half
         tokio::spawn(async move {
@@ -286,76 +463,52 @@ async fn handle_client_read_loop(
 ) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     use tokio::io::BufReader;
     
-    // First, send hello message using WRITE_STREAM
-    {
-        let computer_name = get_computer_name();
-        let screens = crate::input::get_all_screens();
-        let screen_data: Vec<ScreenData> = screens.iter().map(|s| ScreenData {
-            name: s.name.clone(),
-            x: s.x,
-            y: s.y,
-            width: s.width,
-            height: s.height,
-            is_primary: s.is_primary,
-        }).collect();
-        
-        #[cfg(target_os = "macos")]
-        let computer_type = "mac";
-        #[cfg(target_os = "windows")]
-        let computer_type = "windows";
-        #[cfg(not(any(target_os = "macos", target_os = "windows")))]
-        let computer_type = "other";
-        
-        let hello = Message::hello_with_screens(&computer_name, screen_data, computer_type);
-        let json = serde_json::to_string(&hello)? + "\n";
-        
-        // Use the WRITE_STREAM to send hello
-        let writer = { WRITE_STREAM.read().unwrap().clone() };
-        if let Some(writer) = writer {
-            let mut stream = writer.lock().await;
-            stream.write_all(json.as_bytes()).await?;
-            stream.flush().await?;
-            println!("📤 Sent hello to {}", addr);
-        } else {
-            println!("⚠️ No WRITE_STREAM available to send hello!");
-        }
+    // First, send hello message
+    if send_frame(hello_frame()?) {
+        println!("📤 Sent hello to {}", addr);
+    } else {
+        println!("⚠️ No writer task available to send hello!");
     }
     
-    // Read loop using BufReader for proper line handling
-    let mut reader = BufReader::new(read_half);
-    let mut line = String::new();
+    // Read loop using BufReader for proper line handling. Frames are
+    // parsed straight from the raw bytes; serde_json validates UTF-8 in
+    // string fields itself, so read_line's up-front whole-line validation
+    // would be redundant work per frame.
+    let mut reader = BufReader::with_capacity(64 * 1024, read_half);
+    let mut line: Vec<u8> = Vec::new();
     
     loop {
         line.clear();
-        match reader.read_line(&mut line).await {
+        match reader.read_until(b'\n', &mut line).await {
             Ok(0) => {
                 println!("📤 Client {} disconnected", addr);
-                // Only clear state if this was our primary connection
+                // Only clear state if this was our primary connection.
+                // If we have an outgoing connection we're still connected.
                 let is_outgoing = *IS_OUTGOING_CONNECTION.read().unwrap();
                 if !is_outgoing {
-                    // We were server, this client left - clear everything
-                    *IS_CONNECTED.write().unwrap() = false;
-                    *CONNECTED_TO.write().unwrap() = None;
-                    *WRITE_STREAM.write().unwrap() = None;
+                    clear_connection_state();
                 }
-                // If we have an outgoing connection, don't clear state - we're still connected
                 break;
             }
             Ok(_) => {
-                if let Ok(msg) = serde_json::from_str::<Message>(&line) {
+                if let Ok(msg) = serde_json::from_slice::<Message>(&line) {
                     // Use the simple handler (doesn't need stream reference)
                     if let Err(e) = handle_message_simple(&msg).await {
                         eprintln!("Error handling message: {}", e);
                     }
                 }
+                // An oversized frame (hello with many screens, layout sync)
+                // grows the reused buffer; don't keep that memory pinned for
+                // the life of the connection.
+                if line.capacity() > 64 * 1024 {
+                    line.shrink_to(64 * 1024);
+                }
             }
             Err(e) => {
                 eprintln!("Read error from {}: {}", addr, e);
                 let is_outgoing = *IS_OUTGOING_CONNECTION.read().unwrap();
                 if !is_outgoing {
-                    *IS_CONNECTED.write().unwrap() = false;
-                    *CONNECTED_TO.write().unwrap() = None;
-                    *WRITE_STREAM.write().unwrap() = None;
+                    clear_connection_state();
                 }
                 break;
             }
@@ -365,57 +518,212 @@ async fn handle_client_read_loop(
     Ok(())
 }
 
+// Frames refused because the outbound queue was full. Moves dropping under
+// backpressure is by design (newest state wins); a steadily climbing count
+// means the peer has stalled. Logged sparsely so a sustained stall doesn't
+// flood the console from the hot path.
+static DROPPED_FRAMES: std::sync::atomic::AtomicU64 = std::sync::atomic::AtomicU64::new(0);
+
+fn note_dropped_frame() {
+    let dropped = DROPPED_FRAMES.fetch_add(1, std::sync::atomic::Ordering::Relaxed) + 1;
+    if dropped % 64 == 1 {
+        println!("⚠️ Outbound queue full, dropping frames ({} dropped so far)", dropped);
+    }
+}
+
+/// Enqueue one newline-terminated frame for the writer task.
+/// Never blocks, so it is safe to call from the rdev listener thread and
+/// other latency-sensitive callbacks. Returns false when there is no
+/// connection or the queue is full (slow peer).
+fn send_frame(frame: Vec<u8>) -> bool {
+    let guard = OUT_TX.read().unwrap();
+    let tx = match guard.as_ref() {
+        Some(tx) => tx,
+        None => return false,
+    };
+    match tx.try_send(frame) {
+        Ok(()) => true,
+        Err(mpsc::error::TrySendError::Full(_)) => {
+            note_dropped_frame();
+            false
+        }
+        Err(mpsc::error::TrySendError::Closed(_)) => false,
+    }
+}
+
+// Mouse moves stop enqueueing while this much queue headroom remains, so a
+// stalled peer can only ever delay clicks/keys/control frames behind at most
+// OUT_QUEUE_DEPTH - MOVE_CAPACITY_RESERVE moves, never lose them.
+const MOVE_CAPACITY_RESERVE: usize = 16;
+
+/// Like send_frame, but for mouse_move frames, which are superseded by the
+/// next sample anyway: under backpressure they are dropped first, keeping
+/// reserve capacity so discrete events (clicks, keys, control) still fit.
+fn send_move_frame(frame: Vec<u8>) -> bool {
+    let guard = OUT_TX.read().unwrap();
+    let tx = match guard.as_ref() {
+        Some(tx) => tx,
+        None => return false,
+    };
+    if tx.capacity() <= MOVE_CAPACITY_RESERVE {
+        note_dropped_frame();
+        return false;
+    }
+    tx.try_send(frame).is_ok()
+}
+
+/// Spawn the writer task that owns the write half of a connection.
+/// write_all handles partial writes, so a frame is either fully sent or
+/// the connection is treated as broken - never silently truncated.
+fn spawn_writer(mut write_half: OwnedWriteHalf) -> mpsc::Sender<Vec<u8>> {
+    let (tx, mut rx) = mpsc::channel::<Vec<u8>>(OUT_QUEUE_DEPTH);
+    tokio::spawn(async move {
+        // Frames are opaque bytes here; moves are recognized by their fixed
+        // prefix so stale ones can be coalesced away.
+        const MOVE_PREFIX: &[u8] = b"{\"type\":\"mouse_move\"";
+        let is_move = |f: &[u8]| f.starts_with(MOVE_PREFIX);
+        
+        let mut batch: Vec<u8> = Vec::with_capacity(4096);
+        while let Some(frame) = rx.recv().await {
+            // Drain whatever else queued up while the last write was in
+            // flight so a burst of frames costs one write_all instead of
+            // one syscall per frame. Consecutive mouse_move frames collapse
+            // to the newest one - the cursor should jump to where the user
+            // is now, not replay history - while ordering relative to
+            // clicks/keys is preserved and discrete frames are never dropped.
+            // This also means a fast click's press+release usually leaves in
+            // one write without merging them into a combined frame, which
+            // would change the wire format for no fewer syscalls.
+            // Cap how much one drain accumulates: past this, leave the rest
+            // queued for the next write so a deep backlog turns into a few
+            // bounded writes instead of one giant buffered one.
+            const MAX_BATCH_BYTES: usize = 32 * 1024;
+
+            batch.clear();
+            let mut pending = Some(frame);
+            while batch.len() < MAX_BATCH_BYTES {
+                let Ok(next) = rx.try_recv() else { break };
+                if let Some(prev) = pending.take() {
+                    if !(is_move(&prev) && is_move(&next)) {
+                        batch.extend_from_slice(&prev);
+                    }
+                }
+                pending = Some(next);
+            }
+            // After the drain, `pending` always holds the newest frame. When
+            // nothing else survived coalescing the batch is empty - write
+            // that frame in place rather than copying it through the buffer.
+            let last = pending.expect("drain loop always leaves a frame pending");
+            let result = if batch.is_empty() {
+                write_half.write_all(&last).await
+            } else {
+                batch.extend_from_slice(&last);
+                write_half.write_all(&batch).await
+            };
+            if let Err(e) = result {
+                match e.kind() {
+                    std::io::ErrorKind::BrokenPipe | std::io::ErrorKind::ConnectionReset => {
+                        println!("❌ Peer closed connection during send: {}", e);
+                    }
+                    _ => println!("❌ Send failed: {}", e),
+                }
+                clear_connection_state();
+                break;
+            }
+            // Mirror the read loop's capacity clamp: an oversized frame
+            // (clipboard, layout sync) can grow the batch well past the
+            // drain cap; don't keep that memory pinned for the connection.
+            if batch.capacity() > MAX_BATCH_BYTES {
+                batch.shrink_to(MAX_BATCH_BYTES);
+            }
+        }
+    });
+    tx
+}
+
 /// Unified message handler - used by both server and client read loops
 async fn handle_message_simple(msg: &Message) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
+    // Arms ordered hot-first: string matches compile to sequential
+    // compares, so the per-sample types are checked before the per-second
+    // (ping/pong) and per-connection (hello, control, layout) ones.
     match msg.msg_type.as_str() {
-        "ping" => {
-            // Respond to ping with pong using WRITE_STREAM
-            let writer = { WRITE_STREAM.read().unwrap().clone() };
-            if let Some(writer) = writer {
-                let pong = Message::pong();
-                let json = serde_json::to_string(&pong)? + "\n";
-                let mut stream = writer.lock().await;
-                stream.write_all(json.as_bytes()).await?;
+        MSG_MOUSE_MOVE => {
+            if let (Some(x), Some(y)) = (msg.x, msg.y) {
+                // Only move if we're being controlled by remote
+                let being_controlled = *BEING_CONTROLLED.read().unwrap();
+                if being_controlled {
+                    // Log every 20th move to reduce spam
+                    static MOVE_COUNTER: std::sync::atomic::AtomicU32 = std::sync::atomic::AtomicU32::new(0);
+                    let count = MOVE_COUNTER.fetch_add(1, std::sync::atomic::Ordering::SeqCst);
+                    if count % 20 == 0 {
+                        println!("🖱️ mouse_move to ({}, {}) [msg #{}]", x, y, count);
+                    }
+                    crate::input::move_mouse(x, y);
+                } else {
+                    // Log this warning but not too often
+                    static WARN_COUNTER: std::sync::atomic::AtomicU32 = std::sync::atomic::AtomicU32::new(0);
+                    let count = WARN_COUNTER.fetch_add(1, std::sync::atomic::Ordering::SeqCst);
+                    if count < 5 || count % 100 == 0 {
+                        println!("⚠️ mouse_move ignored: BEING_CONTROLLED=false (warning #{}, pos=({},{}))", count, x, y);
+                    }
+                }
             }
         }
-        "pong" => {
-            // Heartbeat response received - connection is alive
-            // No action needed, just silently acknowledge
+        MSG_MOUSE_CLICK => {
+            let being_controlled = *BEING_CONTROLLED.read().unwrap();
+            if let (Some(button), Some(action)) = (&msg.button, &msg.action) {
+                if being_controlled {
+                    println!("🖱️ Mouse click received: {} {}", button, action);
+                    crate::input::mouse_click(button, action);
+                } else {
+                    println!("⚠️ mouse_click ignored: BEING_CONTROLLED=false");
+                }
+            }
         }
-        "hello" => {
-            if let Some(ref name) = msg.name {
-                let comp_type = msg.computer_type.clone().unwrap_or_else(|| "unknown".to_string());
-                println!("📩 Received hello from: {} ({})", name, comp_type);
-                
-                if let Some(ref screens) = msg.screens {
-                    println!("   📺 Received {} screens", screens.len());
-                    for s in screens {
-                        println!("      - {} {}x{} at ({},{})", s.name, s.width, s.height, s.x, s.y);
-                    }
-                    let mut remote = REMOTE_SCREENS.write().unwrap();
-                    remote.retain(|s| s.computer_name != *name);
-                    for s in screens {
-                        remote.push(ReceivedScreen {
-                            computer_name: name.clone(),
-                            computer_type: comp_type.clone(),
-                            name: s.name.clone(),
-                            x: s.x,
-                            y: s.y,
-                            width: s.width,
-                            height: s.height,
-                            is_primary: s.is_primary,
-                        });
+        MSG_KEY_EVENT => {
+            let being_controlled = *BEING_CONTROLLED.read().unwrap();
+            if let (Some(key_code), Some(action)) = (msg.key_code, &msg.action) {
+                // 0 is the sender's "unknown key" sentinel; synthesizing it
+                // would press an arbitrary key, so drop it here too in case
+                // an older peer still forwards unmapped keys.
+                if key_code == 0 {
+                    return Ok(());
+                }
+                if being_controlled {
+                    // Track what we synthesize as down so control_end can
+                    // lift anything the sender never got to release.
+                    {
+                        let mut held = REMOTE_HELD_KEYS.lock().unwrap();
+                        if action == "press" {
+                            if !held.contains(&key_code) {
+                                held.push(key_code);
+                            }
+                        } else {
+                            held.retain(|&k| k != key_code);
+                        }
                     }
-                    println!("   ✅ Now have {} total remote screens", remote.len());
+                    println!("⌨️ Key event received: {} {}", key_code, action);
+                    crate::input::key_event(key_code, action);
+                } else {
+                    println!("⚠️ key_event ignored: BEING_CONTROLLED=false");
                 }
             }
         }
-        "control_start" => {
+        MSG_PING => {
+            // Respond to ping with pong
+            send_frame(PONG_FRAME.to_vec());
+        }
+        MSG_PONG => {
+            // Heartbeat response received - connection is alive
+            // No action needed, just silently acknowledge
+        }
+        MSG_CONTROL_START => {
             // Remote is taking control of our mouse/keyboard
             println!("🎮 =============================================");
             println!("🎮 CONTROL_START: Remote is taking control!");
             println!("🎮 =============================================");
             *BEING_CONTROLLED.write().unwrap() = true;
+            MOVE_RX_SEQ.store(0, std::sync::atomic::Ordering::Relaxed);
             println!("🎮 BEING_CONTROLLED set to TRUE");
             
             // Hide cursor on the controlled machine
@@ -424,16 +732,15 @@ async fn handle_message_simple(msg: &Message) -> Result<(), Box<dyn std::error::
             if let (Some(x), Some(y)) = (msg.x, msg.y) {
                 // Clamp to valid screen coordinates
                 let screens = crate::input::get_all_screens();
-                let min_x = screens.iter().map(|s| s.x).min().unwrap_or(0);
-                let max_x = screens.iter().map(|s| s.x + s.width).max().unwrap_or(1920);
-                let min_y = screens.iter().map(|s| s.y).min().unwrap_or(0);
-                let max_y = screens.iter().map(|s| s.y + s.height).max().unwrap_or(1080);
+                let b = Bounds::of_local(&screens);
                 
-                let clamped_x = x.clamp(min_x, max_x - 1);
-                let clamped_y = y.clamp(min_y, max_y - 1);
-                
-                println!("🖱️ Moving mouse to ({}, {}) [clamped from ({}, {})]", clamped_x, clamped_y, x, y);
-                println!("   Screen bounds: x={}-{}, y={}-{}", min_x, max_x, min_y, max_y);
+                let (clamped_x, clamped_y) = b.clamp_point(x, y);
+
+                println!("🖱️ Moving mouse to ({}, {})", clamped_x, clamped_y);
+                if !b.contains(x, y) {
+                    println!("   (clamped from ({}, {}); bounds x:[{},{}] y:[{},{}])",
+                             x, y, b.min_x, b.max_x, b.min_y, b.max_y);
+                }
                 
                 crate::input::move_mouse(clamped_x, clamped_y);
                 
@@ -445,64 +752,53 @@ async fn handle_message_simple(msg: &Message) -> Result<(), Box<dyn std::error::
             }
             println!("🎮 =============================================");
         }
-        "control_end" => {
+        MSG_CONTROL_END => {
             println!("🔓 =============================================");
             println!("🔓 CONTROL_END: Remote released control");
             *BEING_CONTROLLED.write().unwrap() = false;
             println!("🔓 BEING_CONTROLLED set to FALSE");
-            
+
+            // The sender's hook stopped forwarding the moment it released
+            // control, so any keys it pressed here are orphaned - lift them.
+            lift_remote_held_keys();
+
             // Show cursor again on the controlled machine
             crate::input::show_cursor();
-            
+
             println!("🔓 =============================================");
         }
-        "layout_sync" => {
+        MSG_LAYOUT_SYNC => {
             if let Some(layout) = &msg.layout {
                 println!("📐 Received layout sync: {}", layout);
                 *SYNCED_LAYOUT.write().unwrap() = Some(layout.clone());
             }
         }
-        "mouse_move" => {
-            if let (Some(x), Some(y)) = (msg.x, msg.y) {
-                // Only move if we're being controlled by remote
-                let being_controlled = *BEING_CONTROLLED.read().unwrap();
-                if being_controlled {
-                    // Log every 20th move to reduce spam
-                    static MOVE_COUNTER: std::sync::atomic::AtomicU32 = std::sync::atomic::AtomicU32::new(0);
-                    let count = MOVE_COUNTER.fetch_add(1, std::sync::atomic::Ordering::SeqCst);
-                    if count % 20 == 0 {
-                        println!("🖱️ mouse_move to ({}, {}) [msg #{}]", x, y, count);
+        MSG_HELLO => {
+            if let Some(ref name) = msg.name {
+                let comp_type = msg.computer_type.clone().unwrap_or_else(|| "unknown".to_string());
+                println!("📩 Received hello from: {} ({})", name, comp_type);
+                
+                if let Some(ref screens) = msg.screens {
+                    println!("   📺 Received {} screens", screens.len());
+                    for s in screens {
+                        println!("      - {} {}x{} at ({},{})", s.name, s.width, s.height, s.x, s.y);
                     }
-                    crate::input::move_mouse(x, y);
-                } else {
-                    // Log this warning but not too often
-                    static WARN_COUNTER: std::sync::atomic::AtomicU32 = std::sync::atomic::AtomicU32::new(0);
-                    let count = WARN_COUNTER.fetch_add(1, std::sync::atomic::Ordering::SeqCst);
-                    if count < 5 || count % 100 == 0 {
-                        println!("⚠️ mouse_move ignored: BEING_CONTROLLED=false (warning #{}, pos=({},{}))", count, x, y);
+                    let mut remote = REMOTE_SCREENS.write().unwrap();
+                    remote.retain(|s| s.computer_name != *name);
+                    for s in screens {
+                        remote.push(ReceivedScreen {
+                            computer_name: name.clone(),
+                            computer_type: comp_type.clone(),
+                            name: s.name.clone(),
+                            x: s.x,
+                            y: s.y,
+                            width: s.width,
+                            height: s.height,
+                            is_primary: s.is_primary,
+                        });
                     }
-                }
-            }
-        }
-        "mouse_click" => {
-            let being_controlled = *BEING_CONTROLLED.read().unwrap();
-            if let (Some(button), Some(action)) = (&msg.button, &msg.action) {
-                if being_controlled {
-                    println!("🖱️ Mouse click received: {} {}", button, action);
-                    crate::input::mouse_click(button, action);
-                } else {
-                    println!("⚠️ mouse_click ignored: BEING_CONTROLLED=false");
-                }
-            }
-        }
-        "key_event" => {
-            let being_controlled = *BEING_CONTROLLED.read().unwrap();
-            if let (Some(key_code), Some(action)) = (msg.key_code, &msg.action) {
-                if being_controlled {
-                    println!("⌨️ Key event received: {} {}", key_code, action);
-                    crate::input::key_event(key_code, action);
-                } else {
-                    println!("⚠️ key_event ignored: BEING_CONTROLLED=false");
+                    println!("   ✅ Now have {} total remote screens", remote.len());
+                    *REMOTE_BOUNDS.write().unwrap() = Some(Bounds::of_remote(&remote));
                 }
             }
         }
@@ -518,71 +814,49 @@ pub async fn connect_to_server(ip: &str, port: u16) -> Result<(), Box<dyn std::e
     let stream = TcpStream::connect(format!("{}:{}", ip, port)).await?;
     println!("✅ TCP connected to {}:{}", ip, port);
     
+    // Same tuning as the accept path: no Nagle batching of input frames.
+    if let Err(e) = stream.set_nodelay(true) {
+        println!("⚠️ Could not set TCP_NODELAY: {}", e);
+    }
+    tune_socket(&stream);
+    
     // Split the stream into read and write halves
     let (read_half, write_half) = stream.into_split();
     
-    // Store write half for sending messages (non-blocking!)
-    let write_arc = Arc::new(Mutex::new(write_half));
-    println!("📤 Setting WRITE_STREAM for sending messages");
-    *WRITE_STREAM.write().unwrap() = Some(write_arc.clone());
+    // Start the writer task for sending messages (non-blocking!)
+    println!("📤 Starting writer task for outgoing connection");
+    *OUT_TX.write().unwrap() = Some(spawn_writer(write_half));
     *IS_OUTGOING_CONNECTION.write().unwrap() = true;
     
     // Send hello with screen info using the write half
-    {
-        let computer_name = get_computer_name();
-        let screens = crate::input::get_all_screens();
-        let screen_data: Vec<ScreenData> = screens.iter().map(|s| ScreenData {
-            name: s.name.clone(),
-            x: s.x,
-            y: s.y,
-            width: s.width,
-            height: s.height,
-            is_primary: s.is_primary,
-        }).collect();
-        
-        #[cfg(target_os = "macos")]
-        let computer_type = "mac";
-        #[cfg(target_os = "windows")]
-        let computer_type = "windows";
-        #[cfg(not(any(target_os = "macos", target_os = "windows")))]
-        let computer_type = "other";
-        
-        let hello = Message::hello_with_screens(&computer_name, screen_data, computer_type);
-        let json = serde_json::to_string(&hello)? + "\n";
-        
-        let mut writer = write_arc.lock().await;
-        writer.write_all(json.as_bytes()).await?;
-    }
+    send_frame(hello_frame()?);
     
     // Start client read loop to receive messages from server (uses read half only)
     let ip_clone = ip.to_string();
     tokio::spawn(async move {
-        let mut reader = BufReader::new(read_half);
-        let mut line = String::new();
+        let mut reader = BufReader::with_capacity(64 * 1024, read_half);
+        let mut line: Vec<u8> = Vec::new();
         loop {
             line.clear();
-            match reader.read_line(&mut line).await {
+            match reader.read_until(b'\n', &mut line).await {
                 Ok(0) => {
                     println!("📤 Disconnected from server {}", ip_clone);
-                    *IS_CONNECTED.write().unwrap() = false;
-                    *CONNECTED_TO.write().unwrap() = None;
-                    *WRITE_STREAM.write().unwrap() = None;
-                    *IS_OUTGOING_CONNECTION.write().unwrap() = false;  // Reset outgoing flag
+                    clear_connection_state();
                     break;
                 }
                 Ok(_) => {
-                    if let Ok(msg) = serde_json::from_str::<Message>(&line) {
+                    if let Ok(msg) = serde_json::from_slice::<Message>(&line) {
                         if let Err(e) = handle_message_simple(&msg).await {
                             eprintln!("Error handling message: {}", e);
                         }
                     }
+                    if line.capacity() > 64 * 1024 {
+                        line.shrink_to(64 * 1024);
+                    }
                 }
                 Err(e) => {
                     eprintln!("Read error: {}", e);
-                    *IS_CONNECTED.write().unwrap() = false;
-                    *CONNECTED_TO.write().unwrap() = None;
-                    *WRITE_STREAM.write().unwrap() = None;
-                    *IS_OUTGOING_CONNECTION.write().unwrap() = false;  // Reset outgoing flag
+                    clear_connection_state();
                     break;
                 }
             }
@@ -592,13 +866,27 @@ pub async fn connect_to_server(ip: &str, port: u16) -> Result<(), Box<dyn std::e
     // Mark as connected
     *IS_CONNECTED.write().unwrap() = true;
     *CONNECTED_TO.write().unwrap() = Some(ip.to_string());
+    if let Ok(peer_ip) = ip.parse() {
+        *UDP_PEER.write().unwrap() = Some(SocketAddr::new(peer_ip, UDP_EVENT_PORT));
+    }
+    CONNECTED_NOTIFY.notify_one();
+    ensure_input_listener();
     
     println!("✅ Connection established to {}:{}", ip, port);
     
     Ok(())
 }
 
-fn get_computer_name() -> String {
+/// The machine's display name, resolved once. On macOS this forks `scutil`,
+/// which is far too expensive to repeat from the discovery broadcast loop or
+/// per UI query; the name effectively never changes while the app runs.
+static COMPUTER_NAME: Lazy<String> = Lazy::new(query_computer_name);
+
+pub fn get_computer_name() -> String {
+    COMPUTER_NAME.clone()
+}
+
+fn query_computer_name() -> String {
     #[cfg(target_os = "macos")]
     {
         std::process::Command::new("scutil")
@@ -626,14 +914,33 @@ fn get_computer_type() -> &'static str {
     { "other" }
 }
 
+/// Build the encoded hello frame sent at the start of every connection.
+/// One definition for both the accept and connect paths; the name and
+/// computer type come from their caches, the screen list from the TTL'd
+/// screen cache, so only the serde encode is paid per connection.
+fn hello_frame() -> serde_json::Result<Vec<u8>> {
+    let computer_name = get_computer_name();
+    let screen_data: Vec<ScreenData> = crate::input::get_all_screens()
+        .iter()
+        .map(|s| ScreenData {
+            name: s.name.clone(),
+            x: s.x,
+            y: s.y,
+            width: s.width,
+            height: s.height,
+            is_primary: s.is_primary,
+        })
+        .collect();
+    let hello = Message::hello_with_screens(&computer_name, screen_data, get_computer_type());
+    encode_frame(&hello)
+}
+
 // ============= AUTO-DISCOVERY =============
 
 /// Start everything: TCP server + UDP broadcast + UDP listener + mouse tracking
 /// When a peer is discovered, automatically connect
 pub async fn start_auto_discovery() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
-    let local_ip = local_ip_address::local_ip()
-        .map(|ip| ip.to_string())
-        .unwrap_or_else(|_| "0.0.0.0".to_string());
+    let local_ip = LOCAL_IP.clone().unwrap_or_else(|| "0.0.0.0".to_string());
     
     println!("🚀 Starting MacWinControl auto-discovery...");
     println!("📍 Local IP: {}", local_ip);
@@ -661,6 +968,13 @@ pub async fn start_auto_discovery() -> Result<(), Box<dyn std::error::Error + Se
         }
     });
     
+    // Start UDP event listener (mouse moves from the controlling peer)
+    tokio::spawn(async {
+        if let Err(e) = start_udp_event_listener().await {
+            eprintln!("UDP event listener error: {}", e);
+        }
+    });
+    
     // Start mouse tracking for edge detection
     tokio::spawn(async {
         start_mouse_tracking().await;
@@ -671,129 +985,334 @@ pub async fn start_auto_discovery() -> Result<(), Box<dyn std::error::Error + Se
         start_heartbeat().await;
     });
     
-    // Start input event listener for mouse clicks and keyboard
-    std::thread::spawn(|| {
-        start_input_event_listener();
-    });
-    
+    // The rdev input hook starts on first connection (see
+    // ensure_input_listener): installing a system-wide hook costs a thread
+    // and, on macOS, an accessibility prompt - no reason to pay that while
+    // there is no peer to forward input to.
+
     Ok(())
 }
 
-/// Listen for mouse clicks and keyboard events, forward them when controlling remote
-fn start_input_event_listener() {
-    use rdev::{listen, Event, EventType, Button};
-    
-    println!("🖱️ Starting input event listener for clicks and keyboard...");
-    
-    let callback = move |event: Event| {
-        // Only forward events if we're controlling remote
-        let control_active = *CONTROL_ACTIVE.read().unwrap();
-        if !control_active {
-            return;
+// Starts the rdev hook thread the first time a connection is established.
+// Once installed the hook stays for the life of the process; rdev has no
+// clean unlisten, so it is never torn down on disconnect.
+static INPUT_LISTENER_START: std::sync::Once = std::sync::Once::new();
+
+fn ensure_input_listener() {
+    INPUT_LISTENER_START.call_once(|| {
+        std::thread::spawn(|| {
+            start_input_event_listener();
+        });
+    });
+}
+
+/// Translate an rdev key to the Windows virtual-key code used on the wire.
+/// The wire format is VK regardless of platform; the receiving side maps it
+/// to its native codes. Keys with no sensible VK equivalent return 0 and are
+/// not forwarded. Static match, so the lookup compiles to a jump table.
+fn rdev_key_to_vk(key: rdev::Key) -> u32 {
+    use rdev::Key;
+    match key {
+        Key::Backspace => 0x08,
+        Key::Tab => 0x09,
+        Key::Return => 0x0D,
+        Key::Pause => 0x13,
+        Key::CapsLock => 0x14,
+        Key::Escape => 0x1B,
+        Key::Space => 0x20,
+        Key::PageUp => 0x21,
+        Key::PageDown => 0x22,
+        Key::End => 0x23,
+        Key::Home => 0x24,
+        Key::LeftArrow => 0x25,
+        Key::UpArrow => 0x26,
+        Key::RightArrow => 0x27,
+        Key::DownArrow => 0x28,
+        Key::PrintScreen => 0x2C,
+        Key::Insert => 0x2D,
+        Key::Delete => 0x2E,
+        Key::Num0 => 0x30,
+        Key::Num1 => 0x31,
+        Key::Num2 => 0x32,
+        Key::Num3 => 0x33,
+        Key::Num4 => 0x34,
+        Key::Num5 => 0x35,
+        Key::Num6 => 0x36,
+        Key::Num7 => 0x37,
+        Key::Num8 => 0x38,
+        Key::Num9 => 0x39,
+        Key::KeyA => 0x41,
+        Key::KeyB => 0x42,
+        Key::KeyC => 0x43,
+        Key::KeyD => 0x44,
+        Key::KeyE => 0x45,
+        Key::KeyF => 0x46,
+        Key::KeyG => 0x47,
+        Key::KeyH => 0x48,
+        Key::KeyI => 0x49,
+        Key::KeyJ => 0x4A,
+        Key::KeyK => 0x4B,
+        Key::KeyL => 0x4C,
+        Key::KeyM => 0x4D,
+        Key::KeyN => 0x4E,
+        Key::KeyO => 0x4F,
+        Key::KeyP => 0x50,
+        Key::KeyQ => 0x51,
+        Key::KeyR => 0x52,
+        Key::KeyS => 0x53,
+        Key::KeyT => 0x54,
+        Key::KeyU => 0x55,
+        Key::KeyV => 0x56,
+        Key::KeyW => 0x57,
+        Key::KeyX => 0x58,
+        Key::KeyY => 0x59,
+        Key::KeyZ => 0x5A,
+        Key::MetaLeft => 0x5B,
+        Key::MetaRight => 0x5C,
+        Key::Kp0 => 0x60,
+        Key::Kp1 => 0x61,
+        Key::Kp2 => 0x62,
+        Key::Kp3 => 0x63,
+        Key::Kp4 => 0x64,
+        Key::Kp5 => 0x65,
+        Key::Kp6 => 0x66,
+        Key::Kp7 => 0x67,
+        Key::Kp8 => 0x68,
+        Key::Kp9 => 0x69,
+        Key::KpMultiply => 0x6A,
+        Key::KpPlus => 0x6B,
+        Key::KpMinus => 0x6D,
+        Key::KpDelete => 0x6E,  // keypad decimal point
+        Key::KpDivide => 0x6F,
+        Key::KpReturn => 0x0D,  // no distinct VK; same code as Return
+        Key::F1 => 0x70,
+        Key::F2 => 0x71,
+        Key::F3 => 0x72,
+        Key::F4 => 0x73,
+        Key::F5 => 0x74,
+        Key::F6 => 0x75,
+        Key::F7 => 0x76,
+        Key::F8 => 0x77,
+        Key::F9 => 0x78,
+        Key::F10 => 0x79,
+        Key::F11 => 0x7A,
+        Key::F12 => 0x7B,
+        Key::NumLock => 0x90,
+        Key::ScrollLock => 0x91,
+        Key::ShiftLeft => 0xA0,
+        Key::ShiftRight => 0xA1,
+        Key::ControlLeft => 0xA2,
+        Key::ControlRight => 0xA3,
+        Key::Alt => 0xA4,
+        Key::AltGr => 0xA5,
+        Key::SemiColon => 0xBA,
+        Key::Equal => 0xBB,
+        Key::Comma => 0xBC,
+        Key::Minus => 0xBD,
+        Key::Dot => 0xBE,
+        Key::Slash => 0xBF,
+        Key::BackQuote => 0xC0,
+        Key::LeftBracket => 0xDB,
+        Key::BackSlash => 0xDC,
+        Key::RightBracket => 0xDD,
+        Key::Quote => 0xDE,
+        _ => 0,
+    }
+}
+
+/// Map an rdev button to its wire name. Shared by press and release so the
+/// protocol strings live in exactly one place; buttons we don't forward
+/// (side/extra buttons) map to None. Returns &'static str so the per-click
+/// path allocates nothing for the name.
+fn button_name(button: rdev::Button) -> Option<&'static str> {
+    use rdev::Button;
+    match button {
+        Button::Left => Some("left"),
+        Button::Right => Some("right"),
+        Button::Middle => Some("middle"),
+        _ => None,
+    }
+}
+
+/// Handle a local key press/release from the rdev hook: update modifier
+/// state (always), then forward the event while controlling the remote.
+/// Returns true when the keystroke belongs to the remote and must be
+/// suppressed locally - every key while controlling, including unmapped
+/// ones, so typed input never reaches the local foreground window.
+fn handle_local_key(key: rdev::Key, pressed: bool) -> bool {
+    use std::sync::atomic::Ordering;
+    match key {
+        rdev::Key::ControlLeft | rdev::Key::ControlRight => {
+            CTRL_PRESSED.store(pressed, Ordering::Relaxed);
         }
-        
-        match event.event_type {
-            EventType::ButtonPress(button) => {
-                let button_name = match button {
-                    Button::Left => "left",
-                    Button::Right => "right",
-                    Button::Middle => "middle",
-                    _ => return,
-                };
+        rdev::Key::Alt | rdev::Key::AltGr => {
+            ALT_PRESSED.store(pressed, Ordering::Relaxed);
+        }
+        _ => {}
+    }
+
+    if !CONTROL_ACTIVE.load(Ordering::Relaxed) {
+        return false;
+    }
+
+    // Escape hotkey: Ctrl+Alt+M hands control back to this machine without
+    // hunting for the return edge. Two atomic loads, checked only while
+    // controlling and only on a press of M.
+    if pressed
+        && matches!(key, rdev::Key::KeyM)
+        && CTRL_PRESSED.load(Ordering::Relaxed)
+        && ALT_PRESSED.load(Ordering::Relaxed)
+    {
+        println!("⌨️ Ctrl+Alt+M pressed - releasing control");
+        release_control();
+        return true;
+    }
+
+    let vk = rdev_key_to_vk(key);
+    if vk != 0 {
+        send_key_to_remote(vk, if pressed { "press" } else { "release" });
+    }
+    true
+}
+
+/// Shared hook body for grab and listen. Returns true when the event was
+/// forwarded to the remote and must be suppressed locally (only grab can
+/// actually honor that; listen ignores the return value).
+fn handle_input_event(event: &rdev::Event) -> bool {
+    use rdev::EventType;
+
+    match event.event_type {
+        // Mouse motion only wakes the tracking loop, which reads the real
+        // position itself - no forwarding happens from this thread, and
+        // motion is never suppressed: while controlling, the tracker needs
+        // the physical cursor to move off its pinned edge position to
+        // measure deltas.
+        EventType::MouseMove { x, y } => {
+            if CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed) {
+                return false;
+            }
+            // Filter right here in the hook: only moves that land on the
+            // cached trigger line can start an edge transition, so moves
+            // anywhere else on screen are dropped without waking the tokio
+            // task at all. When no trigger is cached yet (startup, or the
+            // layout just changed) wake unconditionally so the tracker can
+            // rebuild it; the tracker's 1s timeout keeps debug info fresh
+            // either way.
+            let near_edge = match *EDGE_TRIGGER.read().unwrap() {
+                Some(trig) => trig.hit(x as i32, y as i32),
+                None => true,
+            };
+            if near_edge && !MOTION_PENDING.swap(true, std::sync::atomic::Ordering::Relaxed) {
+                MOTION_NOTIFY.notify_one();
+            }
+            false
+        }
+
+        // Key events share one path for press and release: modifier state is
+        // tracked in every mode, forwarding (and local suppression) only
+        // while controlling remote.
+        EventType::KeyPress(key) => handle_local_key(key, true),
+        EventType::KeyRelease(key) => handle_local_key(key, false),
+
+        EventType::ButtonPress(button) => {
+            if !CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed) {
+                return false;
+            }
+            if let Some(button_name) = button_name(button) {
+                // Enqueue for the writer task - safe from this non-async
+                // thread. Send before logging: stdout can block and the
+                // click should already be on its way by then.
+                send_click_to_remote_internal(button_name, "press");
                 println!("🖱️ Mouse button press: {}", button_name);
-                
-                // Send click to remote (use blocking send since we're in sync context)
-                let rt = tokio::runtime::Handle::try_current();
-                if let Ok(handle) = rt {
-                    handle.spawn(async move {
-                        send_click_to_remote_internal(button_name, "press").await;
-                    });
-                }
             }
-            EventType::ButtonRelease(button) => {
-                let button_name = match button {
-                    Button::Left => "left",
-                    Button::Right => "right",
-                    Button::Middle => "middle",
-                    _ => return,
-                };
+            // Suppress unforwarded buttons too: a stray click landing in
+            // whatever local window sits under the pinned cursor is never
+            // what the user meant while controlling the remote.
+            true
+        }
+        EventType::ButtonRelease(button) => {
+            if !CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed) {
+                return false;
+            }
+            if let Some(button_name) = button_name(button) {
+                send_click_to_remote_internal(button_name, "release");
                 println!("🖱️ Mouse button release: {}", button_name);
-                
-                let rt = tokio::runtime::Handle::try_current();
-                if let Ok(handle) = rt {
-                    handle.spawn(async move {
-                        send_click_to_remote_internal(button_name, "release").await;
-                    });
-                }
             }
-            // Keyboard events - skip for now, focus on mouse
-            // EventType::KeyPress(key) => { ... }
-            // EventType::KeyRelease(key) => { ... }
-            _ => {}
+            true
         }
-    };
-    
-    if let Err(error) = listen(callback) {
-        println!("❌ Input event listener error: {:?}", error);
+
+        // Scroll isn't forwarded yet; still keep it away from the local
+        // foreground window while the user thinks they're on the remote.
+        EventType::Wheel { .. } => CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed),
     }
 }
 
-async fn send_click_to_remote_internal(button: &str, action: &str) {
-    let writer = { WRITE_STREAM.read().unwrap().clone() };
-    
-    if let Some(writer) = writer {
-        let msg = Message::mouse_click(button, action);
-        let json = serde_json::to_string(&msg).unwrap_or_default() + "\n";
-        let mut stream = writer.lock().await;
-        if let Err(e) = stream.write_all(json.as_bytes()).await {
-            println!("❌ Failed to send mouse click: {}", e);
+/// Install the global input hook: forward clicks and keys while controlling
+/// the remote. Prefers rdev::grab, whose callback can swallow events, so
+/// input forwarded to the remote is NOT also delivered to the local
+/// foreground window - with observe-only listen, every keystroke typed at
+/// the remote (passwords included) would land in whatever local app has
+/// focus for the whole control session.
+fn start_input_event_listener() {
+    use rdev::{grab, listen, Event};
+
+    println!("🖱️ Starting input event listener for clicks and keyboard...");
+
+    let result = grab(move |event: Event| {
+        if handle_input_event(&event) {
+            None
+        } else {
+            Some(event)
+        }
+    });
+
+    // grab needs the same OS permissions as listen but can fail separately
+    // (e.g. no input-monitoring grant). Degrade to observe-only rather than
+    // losing forwarding entirely, and say so loudly: in this mode local
+    // apps also receive everything typed while controlling the remote.
+    if let Err(error) = result {
+        println!("⚠️ Input grab unavailable ({:?}); falling back to observe-only listen.", error);
+        println!("⚠️ Local apps will also receive input while controlling the remote.");
+        if let Err(error) = listen(move |event: Event| {
+            let _ = handle_input_event(&event);
+        }) {
+            println!("❌ Input event listener error: {:?}", error);
         }
     }
 }
 
+fn send_click_to_remote_internal(button: &str, action: &str) {
+    send_frame(mouse_click_frame(button, action));
+}
+
 /// Send periodic ping to keep connection alive and detect disconnects
 async fn start_heartbeat() {
     println!("💓 Starting heartbeat task...");
     let mut ping_count = 0u64;
     
     loop {
+        // Park until there is a connection to monitor; a 5 s tick while
+        // disconnected was just a wasted wakeup.
+        if !*IS_CONNECTED.read().unwrap() {
+            CONNECTED_NOTIFY.notified().await;
+            continue;
+        }
+        
         tokio::time::sleep(tokio::time::Duration::from_secs(5)).await;
         
-        let is_connected = *IS_CONNECTED.read().unwrap();
-        if !is_connected {
+        if !*IS_CONNECTED.read().unwrap() {
             continue;
         }
         
-        // Send ping
-        let writer = { WRITE_STREAM.read().unwrap().clone() };
-        if let Some(writer) = writer {
-            let msg = Message::ping();
-            let json = serde_json::to_string(&msg).unwrap_or_default() + "\n";
-            let mut stream = writer.lock().await;
-            match stream.write_all(json.as_bytes()).await {
-                Ok(_) => {
-                    let _ = stream.flush().await;
-                    ping_count += 1;
-                    if ping_count % 12 == 1 {  // Log once per minute
-                        println!("💓 Heartbeat ping #{} sent", ping_count);
-                    }
-                }
-                Err(e) => {
-                    println!("💔 Heartbeat failed, connection may be dead: {}", e);
-                    // Mark as disconnected to allow reconnection
-                    *IS_CONNECTED.write().unwrap() = false;
-                    *CONNECTED_TO.write().unwrap() = None;
-                    *WRITE_STREAM.write().unwrap() = None;
-                    *IS_OUTGOING_CONNECTION.write().unwrap() = false;
-                    *CONTROL_ACTIVE.write().unwrap() = false;
-                    *BEING_CONTROLLED.write().unwrap() = false;
-                    
-                    // Make sure cursor is visible again after disconnect
-                    crate::input::show_cursor();
-                    
-                    println!("🔌 Connection state cleared, waiting for reconnection...");
-                }
+        // Send ping. Actual write errors are detected (and the connection
+        // state cleared) by the writer task.
+        if send_frame(PING_FRAME.to_vec()) {
+            ping_count += 1;
+            if ping_count % 12 == 1 {  // Log once per minute
+                println!("💓 Heartbeat ping #{} sent", ping_count);
             }
+        } else if *IS_CONNECTED.read().unwrap() {
+            println!("💔 Heartbeat could not be queued, connection may be dead");
         }
     }
 }
@@ -830,20 +1349,36 @@ async fn start_udp_listener(local_ip: &str) -> Result<(), Box<dyn std::error::Er
     let socket = UdpSocket::bind(format!("0.0.0.0:{}", UDP_PORT)).await?;
     println!("👂 Listening for peers on UDP port {}", UDP_PORT);
     
+    // Prevent multiple simultaneous connection attempts; shared with the
+    // spawned connect task, which clears it when the attempt resolves.
+    static CONNECT_IN_FLIGHT: std::sync::atomic::AtomicBool =
+        std::sync::atomic::AtomicBool::new(false);
+    
     let mut buffer = [0u8; 1024];
     let mut last_log_time: u64 = 0;  // Rate limit discovery logs
-    let mut connecting = false;  // Prevent multiple simultaneous connection attempts
     
     loop {
         let (len, _addr) = socket.recv_from(&mut buffer).await?;
-        let message = String::from_utf8_lossy(&buffer[..len]);
-        
+        let datagram = &buffer[..len];
+
+        // Reject foreign traffic on the raw bytes before any string
+        // handling: a broadcast port sees plenty of it, and the common miss
+        // should cost one prefix compare, not a decode plus a Vec of splits.
+        if !(datagram.starts_with(DISCOVERY_MAGIC.as_bytes())
+            && datagram.get(DISCOVERY_MAGIC.len()) == Some(&b'|'))
+        {
+            continue;
+        }
+        let Ok(message) = std::str::from_utf8(datagram) else { continue };
+
         // Parse: MACWINCTRL|name|ip|type
-        let parts: Vec<&str> = message.split('|').collect();
-        if parts.len() >= 4 && parts[0] == DISCOVERY_MAGIC {
-            let peer_name = parts[1].to_string();
-            let peer_ip = parts[2].to_string();
-            let peer_type = parts[3].to_string();
+        let mut parts = message.splitn(5, '|').skip(1);
+        if let (Some(peer_name), Some(peer_ip), Some(peer_type)) =
+            (parts.next(), parts.next(), parts.next())
+        {
+            let peer_name = peer_name.to_string();
+            let peer_ip = peer_ip.to_string();
+            let peer_type = peer_type.to_string();
             
             // Ignore our own broadcasts
             if peer_ip == local_ip {
@@ -851,22 +1386,13 @@ async fn start_udp_listener(local_ip: &str) -> Result<(), Box<dyn std::error::Er
             }
             
             // Rate limit discovery logs (once every 30 seconds)
-            let now = std::time::SystemTime::now()
-                .duration_since(std::time::UNIX_EPOCH)
-                .unwrap_or_default()
-                .as_secs();
+            let now = now_secs();
             
             if now - last_log_time >= 30 {
                 println!("🔍 Discovered peer: {} ({}) at {}", peer_name, peer_type, peer_ip);
                 last_log_time = now;
             }
             
-            // Update discovered peers list
-            let now = std::time::SystemTime::now()
-                .duration_since(std::time::UNIX_EPOCH)
-                .unwrap_or_default()
-                .as_secs();
-            
             {
                 let mut peers = DISCOVERED_PEERS.write().unwrap();
                 if let Some(existing) = peers.iter_mut().find(|p| p.ip == peer_ip) {
@@ -888,28 +1414,34 @@ async fn start_udp_listener(local_ip: &str) -> Result<(), Box<dyn std::error::Er
             // 3. We're not currently trying to connect
             // 4. Our IP is higher than peer's (leadership election to prevent both sides connecting)
             let already_connected = *IS_CONNECTED.read().unwrap();
-            let has_write_stream = WRITE_STREAM.read().unwrap().is_some();
+            let has_write_stream = OUT_TX.read().unwrap().is_some();
             
             // Leadership election: only the machine with the higher IP initiates the connection
             // This prevents both machines from trying to connect simultaneously
             let should_initiate = local_ip > peer_ip.as_str();
             
-            if !already_connected && !has_write_stream && !connecting && should_initiate {
-                connecting = true;
+            if !already_connected && !has_write_stream && should_initiate
+                && !CONNECT_IN_FLIGHT.swap(true, std::sync::atomic::Ordering::SeqCst)
+            {
                 println!("🔗 Auto-connecting to {} (we have higher IP)...", peer_ip);
                 
+                // Connect off the discovery loop: an unreachable peer used to
+                // stall datagram processing for the whole connect timeout
+                // plus a 5 s retry sleep.
                 let peer_ip_clone = peer_ip.clone();
-                match connect_to_server(&peer_ip_clone, TCP_PORT).await {
-                    Ok(_) => {
-                        println!("✅ Connected to {}", peer_ip_clone);
-                    }
-                    Err(e) => {
-                        println!("❌ Failed to connect: {}", e);
-                        // Wait a bit before trying again
-                        tokio::time::sleep(tokio::time::Duration::from_secs(5)).await;
+                tokio::spawn(async move {
+                    match connect_to_server(&peer_ip_clone, TCP_PORT).await {
+                        Ok(_) => {
+                            println!("✅ Connected to {}", peer_ip_clone);
+                        }
+                        Err(e) => {
+                            println!("❌ Failed to connect: {}", e);
+                            // Back off before allowing another attempt
+                            tokio::time::sleep(tokio::time::Duration::from_secs(5)).await;
+                        }
                     }
-                }
-                connecting = false;
+                    CONNECT_IN_FLIGHT.store(false, std::sync::atomic::Ordering::SeqCst);
+                });
             } else if !already_connected && !has_write_stream && !should_initiate {
                 // We wait for the other side to connect to us
                 // Just log once per discovery
@@ -947,24 +1479,116 @@ pub fn get_debug_info() -> DebugInfo {
 static LAST_MOUSE_POS: Lazy<RwLock<(i32, i32)>> = Lazy::new(|| RwLock::new((0, 0)));
 // Track if we need to reinitialize last_pos (after control starts)
 static NEEDS_POS_INIT: Lazy<RwLock<bool>> = Lazy::new(|| RwLock::new(true));
+// Motion wakeup from the rdev listener. While idle the tracking loop parks
+// on this instead of polling at a fixed rate, so an untouched mouse costs
+// zero wakeups (the OS hook fires only on real motion).
+static MOTION_NOTIFY: Lazy<tokio::sync::Notify> = Lazy::new(tokio::sync::Notify::new);
+// Set by the hook when a wakeup is already pending, cleared by the tracking
+// loop when it runs. A high-polling-rate mouse fires the hook up to 1000x/s;
+// collapsing the burst to one notify per loop pass keeps the per-event work
+// in the callback to a single atomic swap.
+static MOTION_PENDING: std::sync::atomic::AtomicBool = std::sync::atomic::AtomicBool::new(false);
+
+/// Receive mouse_move events on the UDP event port. Out-of-order datagrams
+/// are dropped by sequence number so the cursor never jumps backwards.
+async fn start_udp_event_listener() -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
+    let socket = UdpSocket::bind(format!("0.0.0.0:{}", UDP_EVENT_PORT)).await?;
+    // Mirror the sender's buffer bump: enough receive depth that a burst of
+    // datagrams arriving while this task is descheduled isn't dropped.
+    let _ = socket2::SockRef::from(&socket).set_recv_buffer_size(256 * 1024);
+    println!("👂 Listening for move events on UDP port {}", UDP_EVENT_PORT);
+    
+    let mut buffer = [0u8; 256];
+    loop {
+        let Ok((len, addr)) = socket.recv_from(&mut buffer).await else { continue };
+
+        if !*BEING_CONTROLLED.read().unwrap() {
+            continue;
+        }
+
+        // Only the established peer gets to drive the cursor: anything else
+        // on the LAN spraying this port is dropped before parsing. The
+        // sender transmits from an ephemeral port, so match on source IP
+        // (UDP_PEER is set from the TCP connection on both the accept and
+        // connect paths).
+        match *UDP_PEER.read().unwrap() {
+            Some(peer) if peer.ip() == addr.ip() => {}
+            _ => continue,
+        }
+
+        let Ok(msg) = serde_json::from_slice::<Message>(&buffer[..len]) else { continue };
+        if msg.msg_type != MSG_MOUSE_MOVE {
+            continue;
+        }
+        
+        if let Some(seq) = msg.seq {
+            let last = MOVE_RX_SEQ.load(std::sync::atomic::Ordering::Relaxed);
+            if seq <= last {
+                continue;  // stale or duplicate datagram
+            }
+            MOVE_RX_SEQ.store(seq, std::sync::atomic::Ordering::Relaxed);
+        }
+        
+        if let (Some(x), Some(y)) = (msg.x, msg.y) {
+            crate::input::move_mouse(x, y);
+        }
+    }
+}
+
+/// Sampling period while controlling the remote: ~125 Hz. One consolidated
+/// move per tick regardless of how fast the OS delivers raw samples, which
+/// caps the packet/syscall rate; intermediate points are redundant for
+/// absolute positioning. 8 ms sits comfortably above typical display
+/// latency while staying well under a 500 Hz gaming mouse's raw rate.
+const MOVE_SAMPLE_INTERVAL: tokio::time::Duration = tokio::time::Duration::from_millis(8);
 
 /// Start mouse tracking - monitors mouse position and handles edge transitions
 pub async fn start_mouse_tracking() {
     println!("🖱️ Starting mouse tracking...");
     
     let edge_threshold = 15;  // pixels from edge to trigger transition
-    let mut debug_counter = 0u32;
+    // Debug refresh is wall-time based, not pass-counted: loop passes come
+    // at 125 Hz while controlling but only from the 1 s park timeout when
+    // the mouse is idle or away from the trigger edge, so a counter would
+    // stretch the refresh to minutes in exactly the quiet case the debug
+    // panel exists for. None forces a first tick on the first pass.
+    const DEBUG_REFRESH: std::time::Duration = std::time::Duration::from_millis(500);
+    let mut last_debug: Option<std::time::Instant> = None;
     let mut loop_counter = 0u64;
     
     loop {
-        tokio::time::sleep(tokio::time::Duration::from_millis(8)).await;  // ~125 Hz for lower latency
-        
+        // While controlling the remote we sample on a fixed cadence for
+        // smooth deltas. Otherwise we park until the rdev hook reports
+        // motion (1 s timeout keeps debug info fresh and guards against
+        // the hook not running, e.g. missing accessibility permission).
+        if CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed) {
+            tokio::time::sleep(MOVE_SAMPLE_INTERVAL).await;
+        } else {
+            let _ = tokio::time::timeout(
+                tokio::time::Duration::from_secs(1),
+                MOTION_NOTIFY.notified(),
+            ).await;
+            // Re-arm the hook's wakeup gate: motion arriving from here on
+            // warrants a fresh notify.
+            MOTION_PENDING.store(false, std::sync::atomic::Ordering::Relaxed);
+        }
+
         loop_counter += 1;
-        
+
         // Read all state upfront to avoid holding locks across await
         let is_connected = *IS_CONNECTED.read().unwrap();
         let being_controlled = *BEING_CONTROLLED.read().unwrap();
-        let control_active = *CONTROL_ACTIVE.read().unwrap();
+        let control_active = CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed);
+        
+        // Update debug info every ~0.5 seconds regardless of pass rate
+        let debug_tick = last_debug.map_or(true, |t| t.elapsed() >= DEBUG_REFRESH);
+        
+        // Querying the cursor position costs an OS round trip. While
+        // disconnected nothing but the debug panel consumes it, so skip the
+        // query except on debug refresh ticks.
+        if !is_connected && !debug_tick {
+            continue;
+        }
         
         let (mx, my) = crate::input::get_mouse_position();
         
@@ -974,16 +1598,15 @@ pub async fn start_mouse_tracking() {
                 mx, my, is_connected, control_active, being_controlled);
         }
         
-        // Update debug info every ~0.5 seconds (every 60 iterations at 125Hz)
-        debug_counter += 1;
-        if debug_counter >= 60 {
-            debug_counter = 0;
+        if debug_tick {
+            last_debug = Some(std::time::Instant::now());
             let screens = crate::input::get_all_screens();
-            let total_min_x = screens.iter().map(|s| s.x).min().unwrap_or(0);
-            let total_max_x = screens.iter().map(|s| s.x + s.width).max().unwrap_or(1920);
-            let total_min_y = screens.iter().map(|s| s.y).min().unwrap_or(0);
-            let total_max_y = screens.iter().map(|s| s.y + s.height).max().unwrap_or(1080);
-            
+            let b = Bounds::of_local(&screens);
+            let prev = LOCAL_BOUNDS.write().unwrap().replace(b);
+            if prev.map_or(true, |p| p != b) {
+                invalidate_edge_trigger();
+            }
+
             let edge_status = if !is_connected {
                 "Not connected".to_string()
             } else if being_controlled {
@@ -992,10 +1615,10 @@ pub async fn start_mouse_tracking() {
                 "Controlling remote".to_string()
             } else {
                 format!("Watching edges (R:{}, L:{}, T:{}, B:{})",
-                    mx >= total_max_x - edge_threshold,
-                    mx <= total_min_x + edge_threshold,
-                    my <= total_min_y + edge_threshold,
-                    my >= total_max_y - edge_threshold
+                    mx >= b.max_x - edge_threshold,
+                    mx <= b.min_x + edge_threshold,
+                    my <= b.min_y + edge_threshold,
+                    my >= b.max_y - edge_threshold
                 )
             };
             
@@ -1004,13 +1627,10 @@ pub async fn start_mouse_tracking() {
             let mut debug = DEBUG_INFO.write().unwrap();
             debug.mouse_x = mx;
             debug.mouse_y = my;
-            debug.screen_bounds = format!("x:[{},{}] y:[{},{}]", total_min_x, total_max_x, total_min_y, total_max_y);
+            debug.screen_bounds = format!("x:[{},{}] y:[{},{}]", b.min_x, b.max_x, b.min_y, b.max_y);
             debug.edge_status = edge_status;
             debug.remote_screen_count = remote_count;
-            debug.last_update = std::time::SystemTime::now()
-                .duration_since(std::time::UNIX_EPOCH)
-                .unwrap_or_default()
-                .as_secs();
+            debug.last_update = now_secs();
         }
         
         // Skip if not connected
@@ -1028,82 +1648,75 @@ pub async fn start_mouse_tracking() {
         // If we're controlling remote, capture mouse movement and send to remote
         if control_active {
             // Check if we need to initialize last_pos (first iteration after control started)
-            let needs_init = *NEEDS_POS_INIT.read().unwrap();
-            if needs_init {
-                *LAST_MOUSE_POS.write().unwrap() = (mx, my);
-                *NEEDS_POS_INIT.write().unwrap() = false;
-                println!("🎯 Initialized last_pos to ({}, {}) for delta tracking", mx, my);
-                continue;  // Skip this frame, start fresh next frame
+            {
+                let mut needs_init = NEEDS_POS_INIT.write().unwrap();
+                if *needs_init {
+                    *LAST_MOUSE_POS.write().unwrap() = (mx, my);
+                    *needs_init = false;
+                    println!("🎯 Initialized last_pos to ({}, {}) for delta tracking", mx, my);
+                    continue;  // Skip this frame, start fresh next frame
+                }
             }
             
-            let last_pos = *LAST_MOUSE_POS.read().unwrap();
+            // Read-and-update in one lock: the previous position comes out,
+            // the current one goes in, before any early returns below.
+            let last_pos = std::mem::replace(&mut *LAST_MOUSE_POS.write().unwrap(), (mx, my));
             let (remote_x, remote_y) = *REMOTE_MOUSE_POS.read().unwrap();
             
             // Calculate delta from LAST position
             let delta_x = mx - last_pos.0;
             let delta_y = my - last_pos.1;
             
-            // Update last_pos for next iteration BEFORE any early returns
-            *LAST_MOUSE_POS.write().unwrap() = (mx, my);
-            
             // Only send if there's actual movement
             if delta_x != 0 || delta_y != 0 {
-                // Apply sensitivity multiplier for more responsive feel
-                let sensitivity = 1.2;
-                let scaled_delta_x = (delta_x as f64 * sensitivity) as i32;
-                let scaled_delta_y = (delta_y as f64 * sensitivity) as i32;
+                // Update remote mouse position with the scaled delta
+                let (new_remote_x, new_remote_y) =
+                    advance_remote_pos((remote_x, remote_y), (delta_x, delta_y));
                 
                 // Debug: show delta calculation (reduced logging)
                 if loop_counter % 20 == 0 {
-                    println!("🎯 Delta: ({},{}) -> scaled({},{}) | remote({},{}) mouse({},{})", 
-                        delta_x, delta_y, scaled_delta_x, scaled_delta_y, remote_x, remote_y, mx, my);
+                    println!("🎯 Delta: ({},{}) -> ({},{}) | remote({},{}) mouse({},{})", 
+                        delta_x, delta_y, new_remote_x, new_remote_y, remote_x, remote_y, mx, my);
                 }
                 
-                // Update remote mouse position with the delta
-                let new_remote_x = remote_x + scaled_delta_x;
-                let new_remote_y = remote_y + scaled_delta_y;
-                
-                // Get remote screen bounds
-                let remote_screens = REMOTE_SCREENS.read().unwrap().clone();
-                let remote_min_x = remote_screens.iter().map(|s| s.x).min().unwrap_or(0);
-                let remote_max_x = remote_screens.iter().map(|s| s.x + s.width).max().unwrap_or(1920);
-                let remote_min_y = remote_screens.iter().map(|s| s.y).min().unwrap_or(0);
-                let remote_max_y = remote_screens.iter().map(|s| s.y + s.height).max().unwrap_or(1080);
-                
-                // Check if remote mouse would go past the "return" edge
-                let now = std::time::SystemTime::now()
-                    .duration_since(std::time::UNIX_EPOCH)
-                    .unwrap_or_default()
-                    .as_millis() as u64;
-                let start_time = *CONTROL_START_TIME.read().unwrap();
-                let elapsed = now - start_time;
+                // Get remote screen bounds from the cache kept by the
+                // hello handler; default matches an unknown single display.
+                let rb = REMOTE_BOUNDS.read().unwrap().unwrap_or(Bounds::FALLBACK);
                 
                 // Get local screen info for determining which edge we came from
                 let edge_pos = *EDGE_LOCK_POS.read().unwrap();
                 let screens = crate::input::get_all_screens();
-                let total_min_x = screens.iter().map(|s| s.x).min().unwrap_or(0);
-                let total_max_x = screens.iter().map(|s| s.x + s.width).max().unwrap_or(1920);
-                
-                // Check for return to local (after 1.5 second cooldown to prevent immediate return)
-                let should_return = if elapsed > 1500 {
-                    // We went to right edge (Windows is right) - return when at left edge of remote and moving left
-                    if edge_pos.0 >= total_max_x - 30 && new_remote_x <= remote_min_x + 20 && delta_x < -3 {
-                        println!("🔙 Return detected: left edge of remote, moving left (x={}, delta={})", new_remote_x, delta_x);
-                        true
-                    }
-                    // We went to left edge (Windows is left) - return when at right edge of remote and moving right
-                    else if edge_pos.0 <= total_min_x + 30 && new_remote_x >= remote_max_x - 20 && delta_x > 3 {
-                        println!("🔙 Return detected: right edge of remote, moving right");
-                        true
-                    }
-                    else { false }
-                } else { false };
-                
-                if should_return {
+                let lb = Bounds::of_local(&screens);
+
+                // Check for return to local. Geometry first, clock second:
+                // the return conditions almost never hold, so most ticks
+                // skip the clock syscall entirely. The 1.5 s cooldown
+                // prevents bouncing straight back after a transition.
+                // We went right (Windows is right) - return at the remote's left edge moving left;
+                // we went left - return at the remote's right edge moving right.
+                let return_left = edge_pos.0 >= lb.max_x - 30 && new_remote_x <= rb.min_x + 20 && delta_x < -3;
+                let return_right = edge_pos.0 <= lb.min_x + 30 && new_remote_x >= rb.max_x - 20 && delta_x > 3;
+                let returned_after = if return_left || return_right {
+                    let elapsed = CONTROL_START_TIME.read().unwrap().elapsed().as_millis() as u64;
+                    if elapsed > 1500 {
+                        if return_left {
+                            println!("🔙 Return detected: left edge of remote, moving left (x={}, delta={})", new_remote_x, delta_x);
+                        } else {
+                            println!("🔙 Return detected: right edge of remote, moving right");
+                        }
+                        Some(elapsed)
+                    } else { None }
+                } else { None };
+
+                if let Some(elapsed) = returned_after {
                     println!("🔙 Returning control to local after {}ms", elapsed);
-                    *CONTROL_ACTIVE.write().unwrap() = false;
+                    CONTROL_ACTIVE.store(false, std::sync::atomic::Ordering::Relaxed);
                     *NEEDS_POS_INIT.write().unwrap() = true;  // Reset for next time
-                    send_control_message("control_end", 0, 0).await;
+                    if send_frame(CONTROL_END_FRAME.to_vec()) {
+                        println!("📤 Sent control_end message");
+                    } else {
+                        println!("⚠️ Could not queue control_end message");
+                    }
                     
                     // Show cursor again on the controlling machine
                     crate::input::show_cursor();
@@ -1111,24 +1724,29 @@ pub async fn start_mouse_tracking() {
                     // Move mouse back to center of screen
                     let primary = screens.iter().find(|s| s.is_primary).unwrap_or(&screens[0]);
                     let return_y = primary.y + primary.height / 2;
-                    let return_x = if edge_pos.0 >= total_max_x - 30 { 
-                        total_max_x - 100  // Come back from right
+                    let return_x = if edge_pos.0 >= lb.max_x - 30 { 
+                        lb.max_x - 100  // Come back from right
                     } else { 
-                        total_min_x + 100  // Come back from left
+                        lb.min_x + 100  // Come back from left
                     };
                     crate::input::move_mouse(return_x, return_y);
                     println!("🔙 Moved local mouse to ({}, {})", return_x, return_y);
                 } else {
                     // Clamp to remote screen bounds
-                    let clamped_x = new_remote_x.clamp(remote_min_x, remote_max_x - 1);
-                    let clamped_y = new_remote_y.clamp(remote_min_y, remote_max_y - 1);
-                    
-                    // Store new remote position
-                    *REMOTE_MOUSE_POS.write().unwrap() = (clamped_x, clamped_y);
-                    
-                    // Send to remote
-                    send_mouse_to_remote(clamped_x, clamped_y).await;
-                    
+                    let (clamped_x, clamped_y) = rb.clamp_point(new_remote_x, new_remote_y);
+
+                    // When the remote cursor is pinned against a bound, the
+                    // clamped position stops changing even though the local
+                    // mouse keeps producing deltas. Skip the duplicate frame
+                    // - the remote already shows this position.
+                    if (clamped_x, clamped_y) != (remote_x, remote_y) {
+                        // Store new remote position
+                        *REMOTE_MOUSE_POS.write().unwrap() = (clamped_x, clamped_y);
+
+                        // Send to remote
+                        send_mouse_to_remote(clamped_x, clamped_y);
+                    }
+
                     // IMPORTANT: Lock local mouse back to edge position
                     // This prevents the mouse from moving freely on Mac while controlling Windows
                     crate::input::move_mouse(edge_pos.0, edge_pos.1);
@@ -1143,100 +1761,157 @@ pub async fn start_mouse_tracking() {
     }
 }
 
+// Multiplier applied to local mouse deltas before they move the remote
+// cursor; >1 makes the remote feel more responsive.
+const MOUSE_SENSITIVITY: f64 = 1.2;
+
+/// Scale a local movement delta and advance the remote cursor position,
+/// returning the raw (unclamped) result. The caller decides whether the
+/// raw position means "crossed the return edge" before clamping it into
+/// the remote desktop bounds.
+#[inline]
+fn advance_remote_pos(remote: (i32, i32), delta: (i32, i32)) -> (i32, i32) {
+    (
+        remote.0 + (delta.0 as f64 * MOUSE_SENSITIVITY) as i32,
+        remote.1 + (delta.1 as f64 * MOUSE_SENSITIVITY) as i32,
+    )
+}
+
+/// Test the cursor against the single configured transition edge.
+/// Partial evaluation of the edge test: the configured edge and local
+/// bounds change rarely, so fold them into one trigger line ahead of time
+/// and leave a single comparison on the per-event path. Unknown edge values
+/// fall back to "right" like the rest of the layout code.
+#[derive(Clone, Copy, Debug)]
+enum EdgeTrigger {
+    Left(i32),
+    Right(i32),
+    Top(i32),
+    Bottom(i32),
+}
+
+impl EdgeTrigger {
+    fn for_edge(lb: Bounds, edge: &str, threshold: i32) -> EdgeTrigger {
+        match edge {
+            "left" => EdgeTrigger::Left(lb.min_x + threshold),
+            "top" => EdgeTrigger::Top(lb.min_y + threshold),
+            "bottom" => EdgeTrigger::Bottom(lb.max_y - threshold),
+            _ => EdgeTrigger::Right(lb.max_x - threshold),
+        }
+    }
+
+    #[inline]
+    fn hit(self, mx: i32, my: i32) -> bool {
+        match self {
+            EdgeTrigger::Left(v) => mx <= v,
+            EdgeTrigger::Right(v) => mx >= v,
+            EdgeTrigger::Top(v) => my <= v,
+            EdgeTrigger::Bottom(v) => my >= v,
+        }
+    }
+}
+
+// Cached trigger, rebuilt lazily by check_edge_transition after
+// invalidate_edge_trigger() clears it (edge reconfigured, bounds changed).
+static EDGE_TRIGGER: Lazy<RwLock<Option<EdgeTrigger>>> = Lazy::new(|| RwLock::new(None));
+
+pub fn invalidate_edge_trigger() {
+    *EDGE_TRIGGER.write().unwrap() = None;
+}
+
 async fn check_edge_transition(mx: i32, my: i32, threshold: i32) {
-    let screens = crate::input::get_all_screens();
-    if screens.is_empty() { return; }
-    
-    // Find current screen bounds
-    let total_min_x = screens.iter().map(|s| s.x).min().unwrap_or(0);
-    let total_max_x = screens.iter().map(|s| s.x + s.width).max().unwrap_or(1920);
-    let total_min_y = screens.iter().map(|s| s.y).min().unwrap_or(0);
-    let total_max_y = screens.iter().map(|s| s.y + s.height).max().unwrap_or(1080);
-    
-    // Get remote screens
-    let remote_screens = REMOTE_SCREENS.read().unwrap().clone();
-    if remote_screens.is_empty() { return; }
-    
-    // Calculate remote screen bounds
-    let remote_min_x = remote_screens.iter().map(|s| s.x).min().unwrap_or(0);
-    let remote_max_x = remote_screens.iter().map(|s| s.x + s.width).max().unwrap_or(1920);
-    let remote_min_y = remote_screens.iter().map(|s| s.y).min().unwrap_or(0);
-    let remote_max_y = remote_screens.iter().map(|s| s.y + s.height).max().unwrap_or(1080);
-    
-    // Get configured edge direction (which edge leads to Windows)
-    let remote_edge = REMOTE_EDGE.read().unwrap().clone();
-    
-    // Check edges - but only the configured one
-    let at_right_edge = mx >= total_max_x - threshold;
-    let at_left_edge = mx <= total_min_x + threshold;
-    let at_top_edge = my <= total_min_y + threshold;
-    let at_bottom_edge = my >= total_max_y - threshold;
-    
-    // Only trigger on the correct edge based on layout
-    let should_transition = match remote_edge.as_str() {
-        "right" => at_right_edge,
-        "left" => at_left_edge,
-        "top" => at_top_edge,
-        "bottom" => at_bottom_edge,
-        _ => at_right_edge  // Default to right
+    // This runs on every sampled mouse position, and almost every call is a
+    // miss. Order the checks cheapest-first: the remote-bounds cache read is
+    // a copy out of an RwLock, while get_all_screens is an OS query, so a
+    // machine with no peer never pays for the screen enumeration.
+    let Some(rb) = *REMOTE_BOUNDS.read().unwrap() else { return };
+
+    // Local bounds come from the cache the debug tick maintains; only the
+    // first events before it is primed pay for a direct screen query.
+    // (Copy the Option out first: a guard in the match scrutinee would
+    // still be held when the miss arm takes the write lock.)
+    let cached_lb = *LOCAL_BOUNDS.read().unwrap();
+    let lb = match cached_lb {
+        Some(b) => b,
+        None => {
+            let screens = crate::input::get_all_screens();
+            if screens.is_empty() { return; }
+            let b = Bounds::of_local(&screens);
+            *LOCAL_BOUNDS.write().unwrap() = Some(b);
+            b
+        }
     };
-    
-    if !should_transition {
+
+    // Configured edge direction (which edge leads to Windows). Borrow the
+    // guard for the rest of the call instead of cloning the String per tick;
+    // nothing below awaits, so holding the read lock is fine.
+    let edge_guard = REMOTE_EDGE.read().unwrap();
+    let remote_edge = edge_guard.as_str();
+
+    // Only trigger on the configured edge; the precomputed trigger makes
+    // this one comparison on the hot path.
+    let cached_trig = *EDGE_TRIGGER.read().unwrap();
+    let trig = cached_trig.unwrap_or_else(|| {
+        let t = EdgeTrigger::for_edge(lb, remote_edge, threshold);
+        *EDGE_TRIGGER.write().unwrap() = Some(t);
+        t
+    });
+    if !trig.hit(mx, my) {
         return;
     }
     
-    println!("🎯 Edge detected ({})! Local bounds: x={}-{}, y={}-{}", remote_edge, total_min_x, total_max_x, total_min_y, total_max_y);
-    println!("   Remote bounds: x={}-{}, y={}-{}", remote_min_x, remote_max_x, remote_min_y, remote_max_y);
+    println!("🎯 Edge detected ({})! Local bounds: x={}-{}, y={}-{}", remote_edge, lb.min_x, lb.max_x, lb.min_y, lb.max_y);
+    println!("   Remote bounds: x={}-{}, y={}-{}", rb.min_x, rb.max_x, rb.min_y, rb.max_y);
     
     // Calculate relative position (0.0 to 1.0) on local screens
-    let local_height = (total_max_y - total_min_y) as f64;
-    let local_width = (total_max_x - total_min_x) as f64;
-    let relative_y = if local_height > 0.0 { (my - total_min_y) as f64 / local_height } else { 0.5 };
-    let relative_x = if local_width > 0.0 { (mx - total_min_x) as f64 / local_width } else { 0.5 };
+    let local_height = (lb.max_y - lb.min_y) as f64;
+    let local_width = (lb.max_x - lb.min_x) as f64;
+    let relative_y = if local_height > 0.0 { (my - lb.min_y) as f64 / local_height } else { 0.5 };
+    let relative_x = if local_width > 0.0 { (mx - lb.min_x) as f64 / local_width } else { 0.5 };
     
     // Convert to remote coordinates based on which edge we're crossing
-    let remote_height = (remote_max_y - remote_min_y) as f64;
-    let remote_width = (remote_max_x - remote_min_x) as f64;
+    let remote_height = (rb.max_y - rb.min_y) as f64;
+    let remote_width = (rb.max_x - rb.min_x) as f64;
     
-    let (remote_x, remote_y) = match remote_edge.as_str() {
+    let (remote_x, remote_y) = match remote_edge {
         "right" => {
             // Enter remote from left side, map Y proportionally
-            let mapped_y = remote_min_y + (relative_y * remote_height) as i32;
-            (remote_min_x + 10, mapped_y.clamp(remote_min_y, remote_max_y - 1))
+            let mapped_y = rb.min_y + (relative_y * remote_height) as i32;
+            (rb.min_x + 10, mapped_y.clamp(rb.min_y, rb.max_y - 1))
         },
         "left" => {
             // Enter remote from right side, map Y proportionally
-            let mapped_y = remote_min_y + (relative_y * remote_height) as i32;
-            (remote_max_x - 10, mapped_y.clamp(remote_min_y, remote_max_y - 1))
+            let mapped_y = rb.min_y + (relative_y * remote_height) as i32;
+            (rb.max_x - 10, mapped_y.clamp(rb.min_y, rb.max_y - 1))
         },
         "top" => {
             // Enter remote from bottom, map X proportionally
-            let mapped_x = remote_min_x + (relative_x * remote_width) as i32;
-            (mapped_x.clamp(remote_min_x, remote_max_x - 1), remote_max_y - 10)
+            let mapped_x = rb.min_x + (relative_x * remote_width) as i32;
+            (mapped_x.clamp(rb.min_x, rb.max_x - 1), rb.max_y - 10)
         },
         "bottom" => {
             // Enter remote from top, map X proportionally
-            let mapped_x = remote_min_x + (relative_x * remote_width) as i32;
-            (mapped_x.clamp(remote_min_x, remote_max_x - 1), remote_min_y + 10)
+            let mapped_x = rb.min_x + (relative_x * remote_width) as i32;
+            (mapped_x.clamp(rb.min_x, rb.max_x - 1), rb.min_y + 10)
         },
         _ => {
             // Default: right edge
-            let mapped_y = remote_min_y + (relative_y * remote_height) as i32;
-            (remote_min_x + 10, mapped_y.clamp(remote_min_y, remote_max_y - 1))
+            let mapped_y = rb.min_y + (relative_y * remote_height) as i32;
+            (rb.min_x + 10, mapped_y.clamp(rb.min_y, rb.max_y - 1))
         }
     };
     
     println!("   Mapping local ({}, {}) -> remote ({}, {})", mx, my, remote_x, remote_y);
     
     // Calculate edge lock position (where to keep local mouse pinned)
-    let edge_x = match remote_edge.as_str() {
-        "right" => total_max_x - 1,
-        "left" => total_min_x + 1,
+    let edge_x = match remote_edge {
+        "right" => lb.max_x - 1,
+        "left" => lb.min_x + 1,
         _ => mx
     };
-    let edge_y = match remote_edge.as_str() {
-        "top" => total_min_y + 1,
-        "bottom" => total_max_y - 1,
+    let edge_y = match remote_edge {
+        "top" => lb.min_y + 1,
+        "bottom" => lb.max_y - 1,
         _ => my
     };
     
@@ -1245,16 +1920,12 @@ async fn check_edge_transition(mx: i32, my: i32, threshold: i32) {
     *REMOTE_MOUSE_POS.write().unwrap() = (remote_x, remote_y);
     
     // Record start time for cooldown
-    let now = std::time::SystemTime::now()
-        .duration_since(std::time::UNIX_EPOCH)
-        .unwrap_or_default()
-        .as_millis() as u64;
-    *CONTROL_START_TIME.write().unwrap() = now;
+    *CONTROL_START_TIME.write().unwrap() = std::time::Instant::now();
     
     println!("   Edge lock at ({}, {}), remote starts at ({}, {})", edge_x, edge_y, remote_x, remote_y);
     
     // Take control of remote
-    *CONTROL_ACTIVE.write().unwrap() = true;
+    CONTROL_ACTIVE.store(true, std::sync::atomic::Ordering::Relaxed);
     *NEEDS_POS_INIT.write().unwrap() = true;  // Force position reinitialization
     
     // Hide cursor on the controlling machine
@@ -1262,7 +1933,7 @@ async fn check_edge_transition(mx: i32, my: i32, threshold: i32) {
     
     // Send control_start message
     println!("📤 About to send control_start to remote...");
-    send_control_message("control_start", remote_x, remote_y).await;
+    send_control_message(MSG_CONTROL_START, remote_x, remote_y);
     println!("✅ control_start sent, we are now controlling remote");
     
     // Move local mouse to edge position (keep it at edge while controlling)
@@ -1272,97 +1943,122 @@ async fn check_edge_transition(mx: i32, my: i32, threshold: i32) {
 // Counter to reduce log spam - only log every Nth message
 static MOUSE_MSG_COUNTER: std::sync::atomic::AtomicU32 = std::sync::atomic::AtomicU32::new(0);
 
-async fn send_mouse_to_remote(x: i32, y: i32) {
-    let writer = { WRITE_STREAM.read().unwrap().clone() };
-    
-    if let Some(writer) = writer {
-        let msg = Message::mouse_move(x, y);
-        let json = serde_json::to_string(&msg).unwrap_or_default() + "\n";
-        let mut stream = writer.lock().await;
-        let result = stream.write_all(json.as_bytes()).await;
-        
-        // Log every 50th message to avoid spam
-        let count = MOUSE_MSG_COUNTER.fetch_add(1, std::sync::atomic::Ordering::SeqCst);
-        if count % 50 == 0 {
-            if result.is_ok() {
-                println!("🖱️ Sending mouse_move to remote: ({}, {}) [msg #{}]", x, y, count);
-            } else {
-                println!("❌ Failed to send mouse_move: {:?}", result);
-            }
-        }
-    } else {
-        println!("❌ No WRITE_STREAM available for mouse_move!");
+/// Fast-path encoder for the highest-rate frame type. Writes the documented
+/// JSON shape directly instead of building a Message and walking it with
+/// serde, so a move costs one buffer write. Stays on the line-JSON protocol
+/// so existing peers keep parsing it - a packed binary frame would shave
+/// ~40 bytes per move but needs a version handshake both sides understand,
+/// which isn't worth it at ~8 KB/s peak for this frame rate.
+fn mouse_move_frame(x: i32, y: i32, seq: u64) -> Vec<u8> {
+    use std::io::Write;
+    // 96 covers the worst case (coordinates and seq at full width) so the
+    // buffer never reallocates mid-format.
+    let mut buf = Vec::with_capacity(96);
+    let _ = write!(buf, "{{\"type\":\"mouse_move\",\"x\":{},\"y\":{},\"seq\":{}}}\n", x, y, seq);
+    buf
+}
+
+/// Direct formatters for the other per-input frames, same shape serde would
+/// produce. `button` and `action` only ever come from the fixed tables in
+/// this module ("left"/"press"/...), never from user data, so plain
+/// interpolation cannot break the JSON. Everything else (hello, layout
+/// sync, control handoff) still goes through Message + encode_frame: those
+/// fire at most once per connection or edge crossing, where the serde walk
+/// is irrelevant and the struct keeps the optional fields manageable.
+fn mouse_click_frame(button: &str, action: &str) -> Vec<u8> {
+    use std::io::Write;
+    let mut buf = Vec::with_capacity(64);
+    let _ = write!(buf, "{{\"type\":\"mouse_click\",\"button\":\"{}\",\"action\":\"{}\"}}\n", button, action);
+    buf
+}
+
+fn key_event_frame(key_code: u32, action: &str) -> Vec<u8> {
+    use std::io::Write;
+    let mut buf = Vec::with_capacity(64);
+    let _ = write!(buf, "{{\"type\":\"key_event\",\"key_code\":{},\"action\":\"{}\"}}\n", key_code, action);
+    buf
+}
+
+fn send_mouse_to_remote(x: i32, y: i32) {
+    let seq = MOVE_TX_SEQ.fetch_add(1, std::sync::atomic::Ordering::Relaxed) + 1;
+    let frame = mouse_move_frame(x, y, seq);
+    
+    // Prefer the UDP event path: moves are superseded by the next sample,
+    // so a lost datagram costs nothing, while TCP would retransmit it and
+    // delay everything behind it. Fall back to the TCP queue when the
+    // datagram socket or the peer address is unavailable.
+    let sent = match (UDP_EVENT_SOCKET.as_ref(), *UDP_PEER.read().unwrap()) {
+        (Some(sock), Some(peer)) => sock.send_to(&frame, peer).is_ok(),
+        _ => send_move_frame(frame),
+    };
+
+    // Log every 50th message to avoid spam
+    let count = MOUSE_MSG_COUNTER.fetch_add(1, std::sync::atomic::Ordering::SeqCst);
+    if count % 50 == 0 && sent {
+        println!("🖱️ Sending mouse_move to remote: ({}, {}) [msg #{}]", x, y, count);
     }
 }
 
-async fn send_control_message(msg_type: &str, x: i32, y: i32) {
-    println!("📤 Sending {} message at ({}, {})", msg_type, x, y);
-    
-    // Use the dedicated write stream (doesn't conflict with read loop)
-    let writer = { WRITE_STREAM.read().unwrap().clone() };
-    
-    if let Some(writer) = writer {
-        let msg = Message {
-            msg_type: msg_type.to_string(),
-            x: Some(x),
-            y: Some(y),
-            button: None, action: None, key_code: None,
-            text: None, name: None, version: None,
-            screens: None, computer_type: None, layout: None,
-        };
-        let json = serde_json::to_string(&msg).unwrap_or_default() + "\n";
-        println!("📤 Sending JSON: {}", json.trim());
-        let mut stream = writer.lock().await;
-        println!("📤 Got write lock, sending...");
-        match stream.write_all(json.as_bytes()).await {
-            Ok(_) => {
-                println!("✅ Message sent successfully");
-                // Flush to ensure it's sent immediately
-                let _ = stream.flush().await;
-            }
-            Err(e) => println!("❌ Failed to send message: {}", e),
-        }
+fn send_control_message(msg_type: &str, x: i32, y: i32) {
+    let msg = Message {
+        msg_type: msg_type.to_string(),
+        x: Some(x),
+        y: Some(y),
+        ..Default::default()
+    };
+    // Queue first, then log - control handoff is the most latency-visible
+    // moment in the app, and stdout may block.
+    if send_frame(encode_frame(&msg).unwrap_or_default()) {
+        println!("📤 Sent {} message at ({}, {})", msg_type, x, y);
     } else {
-        println!("❌ No write stream available!");
+        println!("⚠️ Could not queue {} message", msg_type);
     }
 }
 
-/// Send keyboard event to remote (will be used when keyboard sharing is implemented)
-#[allow(dead_code)]
-pub async fn send_key_to_remote(key_code: u32, action: &str) {
-    let is_active = *CONTROL_ACTIVE.read().unwrap();
+/// Send keyboard event to remote while we control it
+pub fn send_key_to_remote(key_code: u32, action: &str) {
+    let is_active = CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed);
     if !is_active { return; }
-    
-    let writer = { WRITE_STREAM.read().unwrap().clone() };
-    
-    if let Some(writer) = writer {
-        let msg = Message::key_event(key_code, action);
-        let json = serde_json::to_string(&msg).unwrap_or_default() + "\n";
-        let mut stream = writer.lock().await;
-        let _ = stream.write_all(json.as_bytes()).await;
-    }
+
+    send_frame(key_event_frame(key_code, action));
 }
 
 /// Send mouse click to remote (will be used when click sharing is implemented)
 #[allow(dead_code)]
-pub async fn send_click_to_remote(button: &str, action: &str) {
-    let is_active = *CONTROL_ACTIVE.read().unwrap();
+pub fn send_click_to_remote(button: &str, action: &str) {
+    let is_active = CONTROL_ACTIVE.load(std::sync::atomic::Ordering::Relaxed);
     if !is_active { return; }
-    
-    let writer = { WRITE_STREAM.read().unwrap().clone() };
-    
-    if let Some(writer) = writer {
-        let msg = Message::mouse_click(button, action);
-        let json = serde_json::to_string(&msg).unwrap_or_default() + "\n";
-        let mut stream = writer.lock().await;
-        let _ = stream.write_all(json.as_bytes()).await;
-    }
+
+    send_click_to_remote_internal(button, action);
 }
 
-/// Release control back to local (can be called from UI)
-#[allow(dead_code)]
+/// Release control back to local: used by the Ctrl+Alt+M escape hotkey,
+/// and callable from the UI. Tells the peer control ended so it shows its
+/// cursor again.
 pub fn release_control() {
-    *CONTROL_ACTIVE.write().unwrap() = false;
+    // Lift modifiers we forwarded as pressed before announcing the handoff:
+    // once CONTROL_ACTIVE drops, the local releases of the hotkey's own
+    // Ctrl/Alt stop being forwarded, which left them stuck down on the
+    // remote. We track pressed state without the side, so release both
+    // variants - a keyup for an already-up key is a no-op. These must be
+    // queued ahead of control_end; the peer ignores key events once
+    // BEING_CONTROLLED clears. Updated peers also lift held keys themselves
+    // on control_end, but older ones rely on these explicit releases.
+    if CTRL_PRESSED.load(std::sync::atomic::Ordering::Relaxed) {
+        send_frame(key_event_frame(0xA2, "release"));
+        send_frame(key_event_frame(0xA3, "release"));
+    }
+    if ALT_PRESSED.load(std::sync::atomic::Ordering::Relaxed) {
+        send_frame(key_event_frame(0xA4, "release"));
+        send_frame(key_event_frame(0xA5, "release"));
+    }
+    CONTROL_ACTIVE.store(false, std::sync::atomic::Ordering::Relaxed);
+    *NEEDS_POS_INIT.write().unwrap() = true;
+    if send_frame(CONTROL_END_FRAME.to_vec()) {
+        println!("📤 Sent control_end message");
+    } else {
+        println!("⚠️ Could not queue control_end message");
+    }
     crate::input::show_cursor();
     println!("🔓 Control released back to local");
 }
@@ -1370,15 +2066,9 @@ pub fn release_control() {
 /// Send layout sync to remote
 pub async fn send_layout_sync(layout_json: &str) -> Result<(), Box<dyn std::error::Error + Send + Sync>> {
     println!("📐 Sending layout sync: {}", layout_json);
-    
-    let writer = { WRITE_STREAM.read().unwrap().clone() };
-    
-    if let Some(writer) = writer {
-        let msg = Message::layout_sync(layout_json);
-        let json = serde_json::to_string(&msg)? + "\n";
-        let mut stream = writer.lock().await;
-        stream.write_all(json.as_bytes()).await?;
-        stream.flush().await?;
+
+    let msg = Message::layout_sync(layout_json);
+    if send_frame(encode_frame(&msg)?) {
         println!("✅ Layout sync sent successfully");
         Ok(())
     } else {
@@ -9,6 +9,13 @@ let computers = [];
 let localScreens = [];
 let remoteScreens = [];
 let savedLayout = null;  // Saved screen positions {screenId: {x, y}}
+let layoutView = null;   // Memoized {allScreens, minX, minY, scale, ...} — see computeLayoutView()
+
+// Drop the cached view transform. Call whenever an input to the layout
+// changes (screen lists, saved positions); the next render recomputes it.
+function invalidateLayoutView() {
+    layoutView = null;
+}
 let connectionStatus = { is_connected: false, connected_to: null, discovered_peers: [] };
 
 // Load saved layout from localStorage
@@ -17,6 +24,7 @@ function loadSavedLayout() {
         const saved = localStorage.getItem('macwincontrol_layout');
         if (saved) {
             savedLayout = JSON.parse(saved);
+            invalidateLayoutView();
             console.log('Loaded saved layout:', savedLayout);
         }
     } catch (e) {
@@ -64,10 +72,11 @@ async function checkSyncedLayout() {
             
             // Merge with our saved layout (remote layout takes precedence)
             savedLayout = { ...savedLayout, ...parsed };
+            invalidateLayoutView();
             localStorage.setItem('macwincontrol_layout', JSON.stringify(savedLayout));
             
             // Re-render with new layout
-            renderScreenLayout();
+            requestRender();
             await updateRemoteEdge();
         }
     } catch (e) {
@@ -151,12 +160,30 @@ document.addEventListener('DOMContentLoaded', async () => {
     await loadComputers();
     setupNavigation();
     setupEventListeners();
-    
-    // Poll for updates
-    setInterval(loadRemoteScreens, 2000);
-    setInterval(loadConnectionStatus, 1000);
-    setInterval(loadDebugInfo, 500);  // Debug info polling
-    setInterval(checkSyncedLayout, 1000);  // Check for layout sync from remote
+
+    // One delegated handler for dragging screen boxes, instead of an inline
+    // onmousedown attribute rebuilt into every box on every render.
+    document.getElementById('screenLayout').addEventListener('mousedown', (event) => {
+        const box = event.target.closest('.screen-box');
+        if (!box) return;
+        startDrag(event, box.dataset.id);
+    });
+
+    // Poll for updates from a single pump instead of four independent
+    // timers, so the webview wakes once per tick and slower pollers run
+    // on staggered multiples of the base 500ms interval.
+    let pollTick = 0;
+    setInterval(() => {
+        pollTick++;
+        loadDebugInfo();
+        if (pollTick % 2 === 0) {
+            loadConnectionStatus();
+            checkSyncedLayout();
+        }
+        if (pollTick % 4 === 0) {
+            loadRemoteScreens();
+        }
+    }, 500);
 });
 
 async function loadConnectionStatus() {
@@ -211,20 +238,27 @@ async function loadLocalScreens() {
     try {
         localScreens = await invoke('get_all_screens');
         console.log('Local screens detected:', localScreens);
-        renderScreenLayout();
+        invalidateLayoutView();
+        requestRender();
     } catch (err) {
         console.error('Failed to load screens:', err);
         localScreens = [{ name: 'This Mac', x: 0, y: 0, width: 1920, height: 1080, is_primary: true }];
-        renderScreenLayout();
+        invalidateLayoutView();
+        requestRender();
     }
 }
 
 async function loadRemoteScreens() {
     try {
-        remoteScreens = await invoke('get_remote_screens');
+        const screens = await invoke('get_remote_screens');
+        // Polled every couple of seconds — only treat it as a change (and
+        // drop the cached layout) when the screen set actually differs.
+        if (JSON.stringify(screens) === JSON.stringify(remoteScreens)) return;
+        remoteScreens = screens;
         console.log('Remote screens:', remoteScreens);
+        invalidateLayoutView();
         if (remoteScreens.length > 0) {
-            renderScreenLayout();
+            requestRender();
             // Update the edge configuration based on current layout
             await updateRemoteEdge();
         }
@@ -300,20 +334,24 @@ function setupEventListeners() {
     }, 500);
 }
 
+// Rendered markup from the last call; the connection status polls every
+// second and the peer list almost never changes, so skip the DOM teardown
+// when the output is identical.
+let lastPeersHtml = '';
+
 function renderDiscoveredPeers() {
     const container = document.getElementById('computers');
-    
+
+    let html;
     if (connectionStatus.discovered_peers.length === 0) {
-        container.innerHTML = `
+        html = `
             <div style="text-align: center; padding: 20px; color: var(--text-light)">
                 <p>🔍 Searching for other computers...</p>
                 <p style="font-size: 12px; margin-top: 10px;">Open MacWinControl on your other computer</p>
             </div>
         `;
-        return;
-    }
-    
-    container.innerHTML = connectionStatus.discovered_peers.map(peer => {
+    } else {
+        html = connectionStatus.discovered_peers.map(peer => {
         const isConnectedToPeer = connectionStatus.connected_to === peer.ip;
         const icon = peer.computer_type === 'mac' ? '🍎' : '🪟';
         return `
@@ -327,7 +365,13 @@ function renderDiscoveredPeers() {
                 </span>
             </div>
         `;
-    }).join('');
+        }).join('');
+    }
+
+    if (html !== lastPeersHtml) {
+        lastPeersHtml = html;
+        container.innerHTML = html;
+    }
 }
 
 function updateStatus(status, text) {
@@ -343,7 +387,7 @@ async function loadComputers() {
     try {
         computers = await invoke('get_computers');
         renderComputers();
-        renderScreenLayout();
+        requestRender();
     } catch (err) {
         console.error('Failed to load computers:', err);
     }
@@ -366,11 +410,28 @@ function renderComputers() {
     `).join('');
 }
 
-function renderScreenLayout() {
-    const layout = document.getElementById('screenLayout');
+// Coalesce render requests into one rebuild per animation frame, so a burst
+// of triggers (poll results landing together, drag end) paints once. All
+// callers go through here; renderScreenLayout() is never invoked directly.
+let renderPending = false;
+function requestRender() {
+    if (renderPending) return;
+    renderPending = true;
+    requestAnimationFrame(() => {
+        renderPending = false;
+        renderScreenLayout();
+    });
+}
+
+// Build everything the layout pane needs to draw: each screen with its
+// resolved position plus the bounds/scale that map screen coordinates into
+// the container. Walking both screen lists and the saved layout is the
+// expensive half of a render, so the result is memoized in layoutView and
+// only rebuilt after invalidateLayoutView().
+function computeLayoutView() {
     const containerWidth = 580;
     const containerHeight = 280;
-    
+
     // Initialize saved layout if needed
     if (!savedLayout) {
         savedLayout = {};
@@ -379,8 +440,11 @@ function renderScreenLayout() {
     let allScreens = [];
     
     // Add local screens - normalize so primary starts at x=0
-    const localMinX = localScreens.length > 0 ? Math.min(...localScreens.map(s => s.x)) : 0;
-    const localMinY = localScreens.length > 0 ? Math.min(...localScreens.map(s => s.y)) : 0;
+    const localBounds = localScreens.length > 0
+        ? screenBounds(localScreens)
+        : { minX: 0, minY: 0 };
+    const localMinX = localBounds.minX;
+    const localMinY = localBounds.minY;
     
     localScreens.forEach((s, i) => {
         const id = `local-${i}`;
@@ -416,10 +480,15 @@ function renderScreenLayout() {
     let remoteStartX = localMaxX + 100; // Gap between local and remote
     
     Object.entries(remoteByComputer).forEach(([computerName, screens]) => {
-        // Normalize this computer's screens
-        const minX = Math.min(...screens.map(s => s.x));
-        const minY = Math.min(...screens.map(s => s.y));
-        
+        // Normalize this computer's screens; one walk collects the min
+        // origin and the rightmost extent together.
+        let minX = Infinity, minY = Infinity, maxRight = -Infinity;
+        for (const s of screens) {
+            if (s.x < minX) minX = s.x;
+            if (s.y < minY) minY = s.y;
+            if (s.x + s.width > maxRight) maxRight = s.x + s.width;
+        }
+
         screens.forEach((s, idx) => {
             const id = `remote-${computerName}-${s.index}`;
             
@@ -453,20 +522,15 @@ function renderScreenLayout() {
         });
         
         // Move start position for next computer
-        const maxRemoteX = Math.max(...screens.map(s => s.x - minX + s.width));
-        remoteStartX += maxRemoteX + 100;
+        remoteStartX += (maxRight - minX) + 100;
     });
     
     if (allScreens.length === 0) {
-        layout.innerHTML = '<p style="color: var(--text-light); text-align: center; padding: 40px;">No screens detected</p>';
-        return;
+        return { allScreens, containerWidth, containerHeight };
     }
-    
+
     // Calculate total bounds for scaling
-    const minX = Math.min(...allScreens.map(s => s.x));
-    const maxX = Math.max(...allScreens.map(s => s.x + s.width));
-    const minY = Math.min(...allScreens.map(s => s.y));
-    const maxY = Math.max(...allScreens.map(s => s.y + s.height));
+    const { minX, maxX, minY, maxY } = screenBounds(allScreens);
     const totalWidth = maxX - minX;
     const totalHeight = maxY - minY;
     
@@ -477,9 +541,48 @@ function renderScreenLayout() {
         0.15  // Max scale
     );
     
-    const innerWidth = totalWidth * scale;
-    const innerHeight = totalHeight * scale;
-    
+    return {
+        allScreens,
+        minX,
+        minY,
+        scale,
+        innerWidth: totalWidth * scale,
+        innerHeight: totalHeight * scale,
+        containerWidth,
+        containerHeight
+    };
+}
+
+// Screen-id list of the boxes currently in the DOM; when the next render
+// has the same set, the existing boxes are repositioned in place instead of
+// rebuilding the pane's HTML.
+let renderedScreenKey = '';
+
+function renderScreenLayout() {
+    const layout = document.getElementById('screenLayout');
+    if (!layoutView) {
+        layoutView = computeLayoutView();
+    }
+    // Destructure once so the per-screen loop reads plain locals instead of
+    // hitting layoutView properties on every coordinate transform.
+    const { allScreens, minX, minY, scale, innerWidth, innerHeight, containerWidth, containerHeight } = layoutView;
+
+    if (allScreens.length === 0) {
+        layout.innerHTML = '<p style="color: var(--text-light); text-align: center; padding: 40px;">No screens detected</p>';
+        renderedScreenKey = '';
+        return;
+    }
+
+    // Same screens as last time: recycle the existing DOM nodes. A full
+    // innerHTML rebuild tears down and reparses every box; position moves
+    // (drags, layout sync) only need style updates.
+    const screenKey = allScreens.map(s => s.id).join('|');
+    if (screenKey === renderedScreenKey && document.getElementById('layoutInner')) {
+        updateScreenBoxes();
+        return;
+    }
+    renderedScreenKey = screenKey;
+
     let html = `
         <div class="screen-layout-container" style="
             position: relative;
@@ -542,7 +645,6 @@ function renderScreenLayout() {
                     font-size: 9px;
                     ${screen.draggable ? 'border: 2px dashed rgba(255,255,255,0.5);' : 'border: 1px solid rgba(255,255,255,0.3);'}
                  "
-                 ${screen.draggable ? `onmousedown="startDrag(event, '${screen.id}')"` : ''}
             >
                 <span style="font-weight: 600; text-shadow: 0 1px 2px rgba(0,0,0,0.3); white-space: nowrap; overflow: hidden; text-overflow: ellipsis; max-width: 90%;">${screen.label}</span>
                 <span style="opacity: 0.8; font-size: 8px;">${screen.width}×${screen.height}</span>
@@ -561,42 +663,91 @@ function renderScreenLayout() {
     layout.innerHTML = html;
 }
 
+// In-place update for the recycled-DOM path: reposition the inner canvas
+// and each screen box from the current layout view. Boxes are visited in
+// document order, which matches allScreens order whenever the id set (and
+// therefore the build order) is unchanged.
+function updateScreenBoxes() {
+    const { allScreens, minX, minY, scale, innerWidth, innerHeight, containerWidth, containerHeight } = layoutView;
+
+    const inner = document.getElementById('layoutInner');
+    inner.style.left = `${(containerWidth - innerWidth) / 2}px`;
+    inner.style.top = `${(containerHeight - innerHeight - 20) / 2}px`;
+    inner.style.width = `${innerWidth}px`;
+    inner.style.height = `${innerHeight}px`;
+
+    const boxes = inner.querySelectorAll('.screen-box');
+    boxes.forEach((box, i) => {
+        const screen = allScreens[i];
+        if (!screen) return;
+        box.style.left = `${(screen.x - minX) * scale}px`;
+        box.style.top = `${(screen.y - minY) * scale}px`;
+        box.style.width = `${Math.max(screen.width * scale, 50)}px`;
+        box.style.height = `${Math.max(screen.height * scale, 35)}px`;
+        box.dataset.originalX = screen.x;
+        box.dataset.originalY = screen.y;
+        box.dataset.scale = scale;
+
+        // Labels are spans created by the full rebuild; write textContent
+        // only when it differs so unchanged text costs no DOM mutation.
+        const [nameSpan, dimSpan] = box.querySelectorAll('span');
+        if (nameSpan && nameSpan.textContent !== screen.label) {
+            nameSpan.textContent = screen.label;
+        }
+        const dims = `${screen.width}×${screen.height}`;
+        if (dimSpan && dimSpan.textContent !== dims) {
+            dimSpan.textContent = dims;
+        }
+    });
+}
+
+// Min/max over all four extents in a single walk of the list, instead of
+// four spread-into-Math.min passes (which also hit the argument limit for
+// very long arrays).
+function screenBounds(screens) {
+    let minX = Infinity, minY = Infinity, maxX = -Infinity, maxY = -Infinity;
+    for (const s of screens) {
+        if (s.x < minX) minX = s.x;
+        if (s.y < minY) minY = s.y;
+        if (s.x + s.width > maxX) maxX = s.x + s.width;
+        if (s.y + s.height > maxY) maxY = s.y + s.height;
+    }
+    return { minX, maxX, minY, maxY };
+}
+
 function getLocalBounds() {
     if (localScreens.length === 0) return { minX: 0, maxX: 1920, minY: 0, maxY: 1080 };
-    return {
-        minX: Math.min(...localScreens.map(s => s.x)),
-        maxX: Math.max(...localScreens.map(s => s.x + s.width)),
-        minY: Math.min(...localScreens.map(s => s.y)),
-        maxY: Math.max(...localScreens.map(s => s.y + s.height))
-    };
+    return screenBounds(localScreens);
 }
 
 function calculateBounds(screens) {
     if (screens.length === 0) return { minX: 0, maxX: 1920, minY: 0, maxY: 1080, width: 1920, height: 1080 };
-    const minX = Math.min(...screens.map(s => s.x));
-    const maxX = Math.max(...screens.map(s => s.x + s.width));
-    const minY = Math.min(...screens.map(s => s.y));
-    const maxY = Math.max(...screens.map(s => s.y + s.height));
+    const { minX, maxX, minY, maxY } = screenBounds(screens);
     return { minX, maxX, minY, maxY, width: maxX - minX, height: maxY - minY };
 }
 
 let draggedElement = null;
 let dragStartX = 0, dragStartY = 0;
 let elemStartX = 0, elemStartY = 0;
+let dragOrigX = 0, dragOrigY = 0;
 let dragScale = 1;
 
-window.startDrag = function(event, screenId) {
+function startDrag(event, screenId) {
     const element = event.target.closest('.screen-box');
     if (!element) return;
-    
+
     // Only allow dragging remote screens
     if (screenId.startsWith('local-')) return;
-    
+
     draggedElement = element;
     dragStartX = event.clientX;
     dragStartY = event.clientY;
     elemStartX = parseInt(element.style.left) || 0;
     elemStartY = parseInt(element.style.top) || 0;
+    // Parse everything the drag needs up front; onDrag/endDrag then work
+    // from plain numbers instead of re-reading dataset strings.
+    dragOrigX = parseInt(element.dataset.originalX) || 0;
+    dragOrigY = parseInt(element.dataset.originalY) || 0;
     dragScale = parseFloat(element.dataset.scale) || 0.1;
     
     element.style.cursor = 'grabbing';
@@ -625,14 +776,13 @@ function endDrag(event) {
     const dy = event.clientY - dragStartY;
     
     // Convert pixel movement back to screen coordinates
-    const origX = parseInt(draggedElement.dataset.originalX) || 0;
-    const origY = parseInt(draggedElement.dataset.originalY) || 0;
-    const newX = origX + Math.round(dx / dragScale);
-    const newY = origY + Math.round(dy / dragScale);
+    const newX = dragOrigX + Math.round(dx / dragScale);
+    const newY = dragOrigY + Math.round(dy / dragScale);
     
     // Save the new position
     if (!savedLayout) savedLayout = {};
     savedLayout[screenId] = { x: newX, y: newY };
+    invalidateLayoutView();
     saveLayout();
     
     console.log(`Moved ${screenId} to (${newX}, ${newY})`);
@@ -648,7 +798,7 @@ function endDrag(event) {
     document.removeEventListener('mouseup', endDrag);
     
     // Re-render with new positions
-    renderScreenLayout();
+    requestRender();
 }
 
 window.removeComputer = async function(ip) {